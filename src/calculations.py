@@ -2,13 +2,52 @@
 Geodesic calculations for the VOR-FIX Coordinate Calculator.
 """
 
+import math
+from typing import Sequence, cast
+
 from geographiclib.geodesic import Geodesic
 
-from .constants import METERS_PER_NAUTICAL_MILE, RADIUS_RANGES
-from .models import Coordinates
+from .constants import MEAN_EARTH_RADIUS_METERS, METERS_PER_NAUTICAL_MILE, RADIUS_RANGES
+from .models import Coordinates, CoordinatesArray
+
+# Initialize the WGS84 ellipsoid model. The C++-backed bindings solve the
+# direct problem an order of magnitude faster than the pure-Python reference
+# implementation, so use them when installed (the "fast" extra); results are
+# identical to full double precision.
+try:
+    from geographiclib_cython import Geodesic as _CythonGeodesic
+
+    GEODESIC = _CythonGeodesic.WGS84
+    _DIRECT_OUTMASK = None
+except ImportError:
+    GEODESIC = Geodesic.WGS84
+    # The pure-Python solver lets us skip output quantities we never read
+    _DIRECT_OUTMASK = Geodesic.LATITUDE | Geodesic.LONGITUDE
+
+# Bind the solver method once; per-call attribute lookup on the shared
+# ellipsoid instance is measurable on bulk paths
+_GEODESIC_DIRECT = GEODESIC.Direct
 
-# Initialize the WGS84 ellipsoid model
-GEODESIC = Geodesic.WGS84
+
+def _direct(latitude: float, longitude: float, azimuth: float, distance_meters: float) -> dict:
+    """
+    Solve the direct geodesic problem for whichever backend is active.
+
+    Args:
+        latitude: Origin latitude in degrees
+        longitude: Origin longitude in degrees
+        azimuth: True bearing in degrees
+        distance_meters: Distance along the geodesic in meters
+
+    Returns:
+        Geodesic result dict containing at least 'lat2' and 'lon2'
+    """
+    # Both backends are untyped; the cast keeps the declared dict return
+    if _DIRECT_OUTMASK is None:
+        return cast(dict, _GEODESIC_DIRECT(latitude, longitude, azimuth, distance_meters))
+    return cast(
+        dict, _GEODESIC_DIRECT(latitude, longitude, azimuth, distance_meters, _DIRECT_OUTMASK)
+    )
 
 
 def calculate_destination_point(
@@ -26,10 +65,131 @@ def calculate_destination_point(
         Coordinates of the destination point
     """
     distance_meters = distance_nm * METERS_PER_NAUTICAL_MILE
-    result = GEODESIC.Direct(origin.latitude, origin.longitude, azimuth, distance_meters)
+    result = _direct(origin.latitude, origin.longitude, azimuth, distance_meters)
     return Coordinates(latitude=result["lat2"], longitude=result["lon2"])
 
 
+def calculate_destination_point_spherical(
+    origin: Coordinates, azimuth: float, distance_nm: float
+) -> Coordinates:
+    """
+    Approximate the destination point using a spherical-earth forward formula.
+
+    This is a closed-form alternative to the ellipsoidal solver — a handful
+    of trig calls instead of Karney's series — at the cost of accuracy: it
+    can deviate from the WGS84 result by tens of meters over typical
+    approach-fix distances. Output coordinates are published at full
+    precision, so this is NOT used by `calculate_waypoint`; it exists for
+    bulk callers that can tolerate spherical accuracy.
+
+    Args:
+        origin: Starting coordinates
+        azimuth: True bearing in degrees (0-360)
+        distance_nm: Distance in nautical miles
+
+    Returns:
+        Coordinates of the approximate destination point
+    """
+    angular_distance = distance_nm * METERS_PER_NAUTICAL_MILE / MEAN_EARTH_RADIUS_METERS
+    lat1 = math.radians(origin.latitude)
+    lon1 = math.radians(origin.longitude)
+    azi = math.radians(azimuth)
+
+    # Each trig quantity is evaluated exactly once; libm calls dominate here
+    sin_lat1 = math.sin(lat1)
+    cos_lat1 = math.cos(lat1)
+    sin_ad = math.sin(angular_distance)
+    cos_ad = math.cos(angular_distance)
+
+    sin_lat2 = sin_lat1 * cos_ad + cos_lat1 * sin_ad * math.cos(azi)
+    lat2 = math.asin(sin_lat2)
+    lon2 = lon1 + math.atan2(
+        math.sin(azi) * sin_ad * cos_lat1,
+        cos_ad - sin_lat1 * sin_lat2,
+    )
+
+    # Normalize longitude to [-180, 180)
+    longitude = (math.degrees(lon2) + 180.0) % 360.0 - 180.0
+    return Coordinates(latitude=math.degrees(lat2), longitude=longitude)
+
+
+def calculate_destination_points(
+    origins: Sequence[Coordinates],
+    azimuths: Sequence[float],
+    distances_nm: Sequence[float],
+) -> list[Coordinates]:
+    """
+    Calculate destination points for a batch of origin/azimuth/distance triples.
+
+    This avoids the per-call overhead of the scalar API when generating many
+    waypoints at once: the geodesic solver is asked only for latitude and
+    longitude (via ``outmask``), skipping the unused output quantities.
+
+    Args:
+        origins: Starting coordinates, one per waypoint
+        azimuths: True bearings in degrees (0-360), one per waypoint
+        distances_nm: Distances in nautical miles, one per waypoint
+
+    Returns:
+        List of destination coordinates, in input order
+
+    Raises:
+        ValueError: If the input sequences have different lengths
+    """
+    if not (len(origins) == len(azimuths) == len(distances_nm)):
+        raise ValueError("origins, azimuths, and distances_nm must have the same length")
+
+    results: list[Coordinates] = []
+    append = results.append
+    for origin, azimuth, distance_nm in zip(origins, azimuths, distances_nm):
+        result = _direct(
+            origin.latitude,
+            origin.longitude,
+            azimuth,
+            distance_nm * METERS_PER_NAUTICAL_MILE,
+        )
+        append(Coordinates(latitude=result["lat2"], longitude=result["lon2"]))
+    return results
+
+
+def calculate_destination_points_array(
+    origins: CoordinatesArray,
+    azimuths: Sequence[float],
+    distances_nm: Sequence[float],
+) -> CoordinatesArray:
+    """
+    Calculate destination points for a batch held in structure-of-arrays form.
+
+    Results are written straight into packed float64 arrays, so no
+    per-waypoint Coordinates objects are allocated for either the inputs or
+    the outputs.
+
+    Args:
+        origins: Starting coordinates as a CoordinatesArray
+        azimuths: True bearings in degrees (0-360), one per waypoint
+        distances_nm: Distances in nautical miles, one per waypoint
+
+    Returns:
+        Destination coordinates as a CoordinatesArray, in input order
+
+    Raises:
+        ValueError: If the input sequences have different lengths
+    """
+    if not (len(origins) == len(azimuths) == len(distances_nm)):
+        raise ValueError("origins, azimuths, and distances_nm must have the same length")
+
+    destinations = CoordinatesArray()
+    append_lat = destinations.latitudes.append
+    append_lon = destinations.longitudes.append
+    for lat, lon, azimuth, distance_nm in zip(
+        origins.latitudes, origins.longitudes, azimuths, distances_nm
+    ):
+        result = _direct(lat, lon, azimuth, distance_nm * METERS_PER_NAUTICAL_MILE)
+        append_lat(result["lat2"])
+        append_lon(result["lon2"])
+    return destinations
+
+
 def magnetic_to_true_bearing(magnetic_bearing: float, declination: float) -> float:
     """
     Convert magnetic bearing to true bearing.
@@ -41,7 +201,13 @@ def magnetic_to_true_bearing(magnetic_bearing: float, declination: float) -> flo
     Returns:
         True bearing in degrees (0-360)
     """
-    return (magnetic_bearing + declination) % 360.0
+    # For validated inputs (bearing in [0, 360), declination in [-180, 180])
+    # the sum is within one revolution of range, so a single branchless
+    # correction per side replaces the slower float modulo.
+    bearing = magnetic_bearing + declination
+    bearing -= 360.0 * (bearing >= 360.0)
+    bearing += 360.0 * (bearing < 0.0)
+    return bearing
 
 
 def get_radius_designator(distance_nm: float) -> str:
@@ -54,12 +220,36 @@ def get_radius_designator(distance_nm: float) -> str:
     Returns:
         Single-letter radius designator (A-Z)
     """
-    for low, high, letter in RADIUS_RANGES:
+    # Non-finite distances fall outside every range; the legacy scan
+    # returned the Z fallback for them, and int() would raise here
+    if not math.isfinite(distance_nm):
+        return "Z"
+
+    # The ranges are regular (each spans x.5 to (x+1).4), so the matching
+    # entry can be computed directly instead of scanning all 26 ranges. The
+    # clamp to 0 covers the A range, which starts at 0.1 rather than 0.5.
+    index = max(0, int(distance_nm + 0.5) - 1)
+    if index < len(RADIUS_RANGES):
+        low, high, letter = RADIUS_RANGES[index]
         if low <= distance_nm <= high:
             return letter
     return "Z"
 
 
+def get_radius_designators(distances_nm: Sequence[float]) -> list[str]:
+    """
+    Get radius designators for a batch of distances.
+
+    Args:
+        distances_nm: Distances in nautical miles
+
+    Returns:
+        Single-letter radius designators, in input order
+    """
+    designator = get_radius_designator
+    return [designator(distance_nm) for distance_nm in distances_nm]
+
+
 def calculate_waypoint(
     origin: Coordinates, magnetic_bearing: float, distance_nm: float, declination: float
 ) -> Coordinates:
@@ -6,6 +6,7 @@ from enum import Enum
 
 # Geodesic constants
 METERS_PER_NAUTICAL_MILE = 1852.0
+MEAN_EARTH_RADIUS_METERS = 6371008.8
 LARGE_DISTANCE_THRESHOLD_NM = 26.5
 
 # Coordinate validation ranges
@@ -78,9 +79,31 @@ class NavAidType(Enum):
         self.code = code
         self.label = label
 
+    @classmethod
+    def by_code(cls, code: str) -> "NavAidType | None":
+        """Get the member with the given data file type code, or None."""
+        return _NAVAID_TYPE_BY_CODE.get(code)
 
-# Radius designator ranges (distance in NM to letter code)
-RADIUS_RANGES = [
+
+# Type code → member, built once when the enum is defined
+_NAVAID_TYPE_BY_CODE = {member.code: member for member in NavAidType}
+
+
+# Precomputed label/code views, built once at import; hot-path consumers
+# (combobox values, label → code dispatch) index these instead of walking
+# the enums and re-reading member attributes
+OPERATION_TYPE_LABELS = tuple(member.label for member in OperationType)
+FIX_TYPE_LABELS = tuple(member.label for member in FixType)
+FIX_USAGE_LABELS = tuple(member.label for member in FixUsage)
+
+OPERATION_CODE_BY_LABEL = {member.label: member.code for member in OperationType}
+FIX_CODE_BY_LABEL = {member.label: member.code for member in FixType}
+FIX_USAGE_CODE_BY_LABEL = {member.label: member.code for member in FixUsage}
+
+
+# Radius designator ranges (distance in NM to letter code); a tuple so the
+# table is immutable and cheap to index
+RADIUS_RANGES = (
     (0.1, 1.4, "A"),
     (1.5, 2.4, "B"),
     (2.5, 3.4, "C"),
@@ -107,7 +130,7 @@ RADIUS_RANGES = [
     (23.5, 24.4, "X"),
     (24.5, 25.4, "Y"),
     (25.5, 26.4, "Z"),
-]
+)
 
 
 # File type constants
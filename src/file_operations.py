@@ -2,20 +2,310 @@
 File operations for reading and parsing navigation data files.
 """
 
-from pathlib import Path
-from typing import Optional
+import concurrent.futures
+import mmap
+import os
+import pickle
+import re
+import stat
+import sys
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, cast
 
 from .constants import (FIX_FILE_IDENTIFIER_INDEX, FIX_FILE_LAT_INDEX, FIX_FILE_LON_INDEX,
                         NAV_FILE_IDENTIFIER_INDEX, NAV_FILE_LAT_INDEX, NAV_FILE_LON_INDEX,
                         NAV_FILE_TENTH_PART_INDEX, FileType)
 from .models import NavAidEntry
 
+# Suffix appended to the data file name for the cached identifier index
+INDEX_SIDECAR_SUFFIX = ".idx.pkl"
+
+# Files at least this large are scanned with one worker process per core
+PARALLEL_SCAN_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Column layout per file type, resolved once at import:
+# (lat_idx, lon_idx, id_idx, name_idx, min_parts, max_tokens); name_idx is
+# None for formats without a name column. max_tokens bounds the line split
+# one past the last consumed column, so trailing tokens collapse into a
+# single remainder element instead of being allocated individually.
+_FILE_SCHEMAS = {
+    FileType.NAV: (
+        NAV_FILE_LAT_INDEX,
+        NAV_FILE_LON_INDEX,
+        NAV_FILE_IDENTIFIER_INDEX,
+        NAV_FILE_TENTH_PART_INDEX,
+        max(NAV_FILE_LAT_INDEX, NAV_FILE_LON_INDEX, NAV_FILE_IDENTIFIER_INDEX),
+        NAV_FILE_TENTH_PART_INDEX + 1,
+    ),
+    FileType.FIX: (
+        FIX_FILE_LAT_INDEX,
+        FIX_FILE_LON_INDEX,
+        FIX_FILE_IDENTIFIER_INDEX,
+        None,
+        max(FIX_FILE_LAT_INDEX, FIX_FILE_LON_INDEX, FIX_FILE_IDENTIFIER_INDEX),
+        FIX_FILE_IDENTIFIER_INDEX + 1,
+    ),
+}
+
+
+def _compile_line_pattern(
+    lat_idx: int, lon_idx: int, id_idx: int, name_idx: Optional[int]
+) -> tuple[re.Pattern[bytes], int, int, int, int, Optional[int]]:
+    """
+    Compile a bytes pattern extracting a schema's columns in one match.
+
+    The pattern tokenizes and extracts in a single C-level scan, replacing
+    split()-plus-indexing on paths that must look at every line. Lines too
+    short to carry the required columns simply fail to match.
+
+    Args:
+        lat_idx: Latitude column index
+        lon_idx: Longitude column index
+        id_idx: Identifier column index
+        name_idx: Name column index, or None if the format has no name
+
+    Returns:
+        The compiled pattern plus the group numbers for the type, latitude,
+        longitude, identifier, and (optional) name columns
+    """
+    consumed = sorted({0, lat_idx, lon_idx, id_idx})
+    pieces = [rb"^\s*"]
+    for col in range(consumed[-1] + 1):
+        if col:
+            pieces.append(rb"\s+")
+        pieces.append(rb"(\S+)" if col in consumed else rb"\S+")
+
+    group_of = {col: group for group, col in enumerate(consumed, start=1)}
+    name_group = None
+    if name_idx is not None:
+        # The name column is optional; skip any columns between it and the
+        # last required one without capturing them
+        filler = rb"\s+\S+" * (name_idx - consumed[-1] - 1)
+        pieces.append(rb"(?:" + filler + rb"\s+(\S+))?")
+        name_group = len(consumed) + 1
+
+    pattern = re.compile(b"".join(pieces))
+    return (
+        pattern,
+        group_of[0],
+        group_of[lat_idx],
+        group_of[lon_idx],
+        group_of[id_idx],
+        name_group,
+    )
+
+
+# Compiled per file type once at import; used where every line is parsed
+_LINE_PATTERNS = {
+    file_type: _compile_line_pattern(lat_idx, lon_idx, id_idx, name_idx)
+    for file_type, (lat_idx, lon_idx, id_idx, name_idx, _, _) in _FILE_SCHEMAS.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _to_needle(identifier: str) -> bytes:
+    """
+    Normalize an identifier to the bytes needle used for line matching.
+
+    Repeated lookups for the same identifier (autocomplete, re-runs) reuse
+    the cached uppercased bytes instead of re-encoding each call.
+
+    Args:
+        identifier: Identifier as entered by the caller
+
+    Returns:
+        Uppercased, UTF-8 encoded identifier
+    """
+    return identifier.upper().encode("utf-8")
+
+
+# In-process memo of loaded indexes keyed by (path, file type); repeated
+# lookups against an unchanged file skip even the sidecar unpickle
+_INDEX_MEMO: dict[tuple[str, str], tuple[tuple[int, int], dict[str, list[NavAidEntry]]]] = {}
+
+
+def _match_line(
+    raw_line: bytes,
+    needle: bytes,
+    lat_idx: int,
+    lon_idx: int,
+    id_idx: int,
+    name_idx: Optional[int],
+    min_parts: int,
+    max_tokens: int,
+    keep_raw: bool,
+) -> Optional[NavAidEntry]:
+    """
+    Parse one data file line if it matches the identifier needle.
+
+    Args:
+        raw_line: Raw line bytes including any trailing newline
+        needle: Uppercased, UTF-8 encoded identifier to match
+        lat_idx: Latitude column index
+        lon_idx: Longitude column index
+        id_idx: Identifier column index
+        name_idx: Name column index, or None if the format has no name
+        min_parts: Highest column index that must be present
+        max_tokens: Bound for the line split; trailing tokens collapse into
+            one remainder element
+        keep_raw: Whether to retain the raw line tokens on the entry
+
+    Returns:
+        The parsed entry, or None if the line doesn't match
+
+    Raises:
+        ValueError: If a matching line contains malformed data
+    """
+    # Cheap bytes-level pre-filter: lines that don't even contain the
+    # identifier as a substring can never match the token check below,
+    # so skip tokenization and decoding entirely.
+    if needle not in raw_line.upper():
+        return None
+
+    # Tokenize in bytes mode; fields are decoded only once a line is
+    # known to match. The split is bounded unless the caller wants every
+    # raw token retained.
+    parts = raw_line.split() if keep_raw else raw_line.split(None, max_tokens)
+
+    # Skip empty and incomplete lines
+    if not parts or len(parts) <= min_parts:
+        return None
+
+    # Token check; the direct comparison hits first for the common
+    # all-uppercase data files, skipping the per-line upper() allocation
+    token = parts[id_idx]
+    if token != needle and token.upper() != needle:
+        return None
+
+    return _parse_entry(parts, lat_idx, lon_idx, id_idx, name_idx, keep_raw)
+
+
+def _parse_entry(
+    parts: list[bytes],
+    lat_idx: int,
+    lon_idx: int,
+    id_idx: int,
+    name_idx: Optional[int],
+    keep_raw: bool,
+) -> NavAidEntry:
+    """
+    Build a NavAidEntry from tokenized line bytes.
+
+    Args:
+        parts: Line tokens in bytes mode
+        lat_idx: Latitude column index
+        lon_idx: Longitude column index
+        id_idx: Identifier column index
+        name_idx: Name column index, or None if the format has no name
+        keep_raw: Whether to retain the raw line tokens on the entry
+
+    Returns:
+        The parsed entry
+
+    Raises:
+        ValueError: If a coordinate token is malformed
+    """
+    # Parse coordinates (float() accepts bytes directly)
+    latitude = float(parts[lat_idx])
+    longitude = float(parts[lon_idx])
+
+    name = None
+    if name_idx is not None and len(parts) > name_idx:
+        name = parts[name_idx].decode("utf-8")
+
+    # Interning deduplicates the heavily repeated type codes and identifiers
+    # across entries and turns later equality checks into pointer compares
+    return NavAidEntry(
+        type_code=sys.intern(parts[0].decode("utf-8")),
+        latitude=latitude,
+        longitude=longitude,
+        identifier=sys.intern(parts[id_idx].decode("utf-8")),
+        name=name,
+        raw_parts=tuple(part.decode("utf-8") for part in parts) if keep_raw else None,
+    )
+
+
+def _scan_chunk(
+    file_path: str,
+    start: int,
+    end: int,
+    file_type: FileType,
+    needle: bytes,
+    keep_raw: bool,
+) -> list[NavAidEntry]:
+    """
+    Scan the lines beginning in the byte range [start, end) for matches.
+
+    Each worker owns the lines that start inside its range; a line that
+    straddles the range end is parsed in full by the worker that owns its
+    first byte.
+
+    Args:
+        file_path: Path to the data file
+        start: First byte offset owned by this worker
+        end: Byte offset where the next worker's range begins
+        file_type: Type of file (NAV or FIX)
+        needle: Uppercased, UTF-8 encoded identifier to match
+        keep_raw: Whether to retain the raw line tokens on each entry
+
+    Returns:
+        List of matching entries, in file order
+
+    Raises:
+        ValueError: If a matching line contains malformed data
+    """
+    lat_idx, lon_idx, id_idx, name_idx, min_parts, max_tokens = _FILE_SCHEMAS[file_type]
+
+    matching_entries: list[NavAidEntry] = []
+
+    with open(file_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            # Advance to the first line boundary at or after start
+            if start == 0:
+                pos = 0
+            else:
+                newline = buffer.find(b"\n", start - 1)
+                if newline == -1:
+                    return matching_entries
+                pos = newline + 1
+
+            size = len(buffer)
+            while pos < end:
+                newline = buffer.find(b"\n", pos)
+                line_end = size if newline == -1 else newline + 1
+                raw_line = buffer[pos:line_end]
+
+                try:
+                    entry = _match_line(
+                        raw_line,
+                        needle,
+                        lat_idx,
+                        lon_idx,
+                        id_idx,
+                        name_idx,
+                        min_parts,
+                        max_tokens,
+                        keep_raw,
+                    )
+                except (ValueError, IndexError) as e:
+                    line_num = buffer[:pos].count(b"\n") + 1
+                    raise ValueError(f"Invalid data format at line {line_num}: {e}") from e
+
+                if entry is not None:
+                    matching_entries.append(entry)
+
+                pos = line_end
+
+    return matching_entries
+
 
 class DataFileReader:
     """Reader for navigation data files (NAV and FIX)."""
 
     @staticmethod
-    def read_file(file_path: str, file_type: FileType, identifier: str) -> list[NavAidEntry]:
+    def read_file(
+        file_path: str, file_type: FileType, identifier: str, keep_raw: bool = False
+    ) -> list[NavAidEntry]:
         """
         Read and parse navigation data file, searching for specific identifier.
 
@@ -23,6 +313,7 @@ class DataFileReader:
             file_path: Path to the data file
             file_type: Type of file (NAV or FIX)
             identifier: Identifier to search for
+            keep_raw: Whether to retain the raw line tokens on each entry
 
         Returns:
             List of matching navigation aid entries
@@ -31,64 +322,329 @@ class DataFileReader:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file format is invalid
         """
-        if not Path(file_path).exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        # Determine indices based on file type
-        if file_type == FileType.NAV:
-            lat_idx = NAV_FILE_LAT_INDEX
-            lon_idx = NAV_FILE_LON_INDEX
-            id_idx = NAV_FILE_IDENTIFIER_INDEX
-            name_idx = NAV_FILE_TENTH_PART_INDEX
-        else:  # FIX
-            lat_idx = FIX_FILE_LAT_INDEX
-            lon_idx = FIX_FILE_LON_INDEX
-            id_idx = FIX_FILE_IDENTIFIER_INDEX
-            name_idx = None
-
-        matching_entries = []
-
-        with open(file_path, "r", encoding="utf-8") as file:
-            for line_num, line in enumerate(file, 1):
-                parts = line.strip().split()
-
-                # Skip empty lines
-                if not parts:
+        return list(DataFileReader.iter_matches(file_path, file_type, identifier, keep_raw))
+
+    @staticmethod
+    def iter_matches(
+        file_path: str, file_type: FileType, identifier: str, keep_raw: bool = False
+    ) -> Iterator[NavAidEntry]:
+        """
+        Yield matching entries lazily, in file order.
+
+        Nothing is materialized beyond the entry being yielded, so callers
+        that only need the first match (or abandon the search early) pay
+        only for the lines scanned so far.
+
+        Args:
+            file_path: Path to the data file
+            file_type: Type of file (NAV or FIX)
+            identifier: Identifier to search for
+            keep_raw: Whether to retain the raw line tokens on each entry
+
+        Yields:
+            Matching navigation aid entries
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is invalid
+        """
+        # A single stat establishes both existence and size
+        try:
+            size = os.stat(file_path).st_size
+        except OSError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
+
+        if size == 0:
+            return
+
+        lat_idx, lon_idx, id_idx, name_idx, min_parts, max_tokens = _FILE_SCHEMAS[file_type]
+
+        # Case-fold and encode the identifier once (cached across calls);
+        # every per-line comparison below reuses the same bytes object.
+        needle = _to_needle(identifier)
+
+        # Large files are scanned with one worker per core; the in-process
+        # path avoids the pool overhead for everything else.
+        if size >= PARALLEL_SCAN_THRESHOLD_BYTES:
+            yield from DataFileReader._read_file_parallel(
+                file_path, size, file_type, needle, keep_raw
+            )
+            return
+
+        match_line = _match_line
+
+        with open(file_path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with buffer:
+            for line_num, raw_line in enumerate(iter(buffer.readline, b""), 1):
+                try:
+                    entry = match_line(
+                        raw_line,
+                        needle,
+                        lat_idx,
+                        lon_idx,
+                        id_idx,
+                        name_idx,
+                        min_parts,
+                        max_tokens,
+                        keep_raw,
+                    )
+                except (ValueError, IndexError) as e:
+                    raise ValueError(f"Invalid data format at line {line_num}: {e}") from e
+
+                if entry is not None:
+                    yield entry
+
+    @staticmethod
+    def read_file_multi(
+        file_path: str, file_type: FileType, identifiers: Iterable[str], keep_raw: bool = False
+    ) -> dict[str, list[NavAidEntry]]:
+        """
+        Search a data file for several identifiers in a single pass.
+
+        A precompiled alternation of the uppercased identifiers pre-filters
+        each line, so k identifiers cost one file scan instead of k.
+
+        Args:
+            file_path: Path to the data file
+            file_type: Type of file (NAV or FIX)
+            identifiers: Identifiers to search for
+            keep_raw: Whether to retain the raw line tokens on each entry
+
+        Returns:
+            Mapping of each uppercased identifier to its matching entries
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is invalid
+        """
+        # A single stat establishes both existence and size
+        try:
+            size = os.stat(file_path).st_size
+        except OSError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
+
+        results: dict[str, list[NavAidEntry]] = {
+            identifier.upper(): [] for identifier in identifiers
+        }
+        if not results or size == 0:
+            return results
+
+        lat_idx, lon_idx, id_idx, name_idx, min_parts, max_tokens = _FILE_SCHEMAS[file_type]
+
+        needles = {key.encode("utf-8") for key in results}
+        prefilter = re.compile(b"|".join(re.escape(needle) for needle in sorted(needles)))
+
+        with open(file_path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with buffer:
+            for line_num, raw_line in enumerate(iter(buffer.readline, b""), 1):
+                if prefilter.search(raw_line.upper()) is None:
                     continue
 
-                # Check if line has enough parts
-                if len(parts) <= max(lat_idx, lon_idx, id_idx):
+                parts = raw_line.split() if keep_raw else raw_line.split(None, max_tokens)
+                if not parts or len(parts) <= min_parts:
                     continue
 
-                # Check if identifier matches
-                if parts[id_idx].upper() != identifier.upper():
+                token = parts[id_idx]
+                if token not in needles:
+                    token = token.upper()
+                    if token not in needles:
+                        continue
+
+                try:
+                    entry = _parse_entry(parts, lat_idx, lon_idx, id_idx, name_idx, keep_raw)
+                except (ValueError, IndexError) as e:
+                    raise ValueError(f"Invalid data format at line {line_num}: {e}") from e
+
+                results[token.decode("utf-8")].append(entry)
+
+        return results
+
+    @staticmethod
+    def _read_file_parallel(
+        file_path: str, size: int, file_type: FileType, needle: bytes, keep_raw: bool
+    ) -> list[NavAidEntry]:
+        """
+        Scan a large data file with one worker process per core.
+
+        Args:
+            file_path: Path to the data file
+            size: File size in bytes
+            file_type: Type of file (NAV or FIX)
+            needle: Uppercased, UTF-8 encoded identifier to match
+            keep_raw: Whether to retain the raw line tokens on each entry
+
+        Returns:
+            List of matching entries, in file order
+
+        Raises:
+            ValueError: If a matching line contains malformed data
+        """
+        workers = os.cpu_count() or 1
+        chunk = max(1, size // workers)
+        starts = list(range(0, size, chunk))
+        ends = starts[1:] + [size]
+
+        matching_entries: list[NavAidEntry] = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk_entries in pool.map(
+                _scan_chunk,
+                [file_path] * len(starts),
+                starts,
+                ends,
+                [file_type] * len(starts),
+                [needle] * len(starts),
+                [keep_raw] * len(starts),
+            ):
+                matching_entries.extend(chunk_entries)
+
+        return matching_entries
+
+    @staticmethod
+    def load_index(file_path: str, file_type: FileType) -> dict[str, list[NavAidEntry]]:
+        """
+        Load the identifier index for a data file, using a cached sidecar when fresh.
+
+        The index maps each uppercased identifier to its entries. It is built
+        in one full pass over the file and persisted next to it as
+        ``<file>.idx.pkl`` stamped with the source's mtime and size, so
+        subsequent loads skip re-parsing entirely.
+
+        Args:
+            file_path: Path to the data file
+            file_type: Type of file (NAV or FIX)
+
+        Returns:
+            Mapping of uppercased identifier to matching entries
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        memo_key = (file_path, file_type.value)
+
+        # Fastest path: the index was already loaded this session and the
+        # file has not changed since
+        memoized = _INDEX_MEMO.get(memo_key)
+        if memoized is not None and memoized[0] == stamp:
+            return memoized[1]
+
+        sidecar_path = file_path + INDEX_SIDECAR_SUFFIX
+
+        # Try the sidecar cache next; any staleness or corruption falls
+        # back to a rebuild.
+        try:
+            with open(sidecar_path, "rb") as sidecar:
+                cached = pickle.load(sidecar)
+            if cached.get("stamp") == stamp and cached.get("file_type") == file_type.value:
+                # The unpickled payload is untyped; the cast restores the
+                # index type the sidecar was written with
+                index = cast(dict[str, list[NavAidEntry]], cached["index"])
+                _INDEX_MEMO[memo_key] = (stamp, index)
+                return index
+        except (OSError, pickle.PickleError, AttributeError, EOFError, KeyError):
+            pass
+
+        index = DataFileReader._build_index(file_path, file_type)
+        _INDEX_MEMO[memo_key] = (stamp, index)
+
+        # Persist best-effort; a read-only data directory is not an error
+        try:
+            with open(sidecar_path, "wb") as sidecar:
+                pickle.dump(
+                    {"stamp": stamp, "file_type": file_type.value, "index": index},
+                    sidecar,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError:
+            pass
+
+        return index
+
+    @staticmethod
+    def lookup(file_path: str, file_type: FileType, identifier: str) -> list[NavAidEntry]:
+        """
+        Point lookup of one identifier through the cached index.
+
+        The first call against a file pays the one-time index build (or
+        sidecar load); subsequent lookups are dict hits, so k lookups cost
+        one scan instead of k.
+
+        Args:
+            file_path: Path to the data file
+            file_type: Type of file (NAV or FIX)
+            identifier: Identifier to search for
+
+        Returns:
+            List of matching navigation aid entries
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        index = DataFileReader.load_index(file_path, file_type)
+        return index.get(identifier.upper(), [])
+
+    @staticmethod
+    def _build_index(file_path: str, file_type: FileType) -> dict[str, list[NavAidEntry]]:
+        """
+        Parse the whole data file into an identifier → entries mapping.
+
+        Unlike `read_file`, which only inspects lines matching one
+        identifier, this sees every line in the file — including headers and
+        other non-data rows — so lines that fail to parse are skipped rather
+        than treated as errors.
+
+        Args:
+            file_path: Path to the data file
+            file_type: Type of file (NAV or FIX)
+
+        Returns:
+            Mapping of uppercased identifier to matching entries
+        """
+        pattern, type_group, lat_group, lon_group, id_group, name_group = _LINE_PATTERNS[
+            file_type
+        ]
+        match = pattern.match
+
+        index: dict[str, list[NavAidEntry]] = {}
+
+        with open(file_path, "rb") as file:
+            for raw_line in file:
+                # One C-level scan tokenizes and extracts; empty and
+                # incomplete lines simply fail to match
+                matched = match(raw_line)
+                if matched is None:
                     continue
 
                 try:
-                    # Parse coordinates
-                    latitude = float(parts[lat_idx])
-                    longitude = float(parts[lon_idx])
+                    latitude = float(matched.group(lat_group))
+                    longitude = float(matched.group(lon_group))
 
-                    # Get name if available
-                    name = None
-                    if name_idx is not None and len(parts) > name_idx:
-                        name = parts[name_idx]
+                    name_token = matched.group(name_group) if name_group is not None else None
+                    name = name_token.decode("utf-8") if name_token else None
 
-                    # Create entry
                     entry = NavAidEntry(
-                        type_code=parts[0],
+                        type_code=matched.group(type_group).decode("utf-8"),
                         latitude=latitude,
                         longitude=longitude,
-                        identifier=parts[id_idx],
+                        identifier=matched.group(id_group).decode("utf-8"),
                         name=name,
-                        raw_parts=parts,
                     )
-                    matching_entries.append(entry)
 
-                except (ValueError, IndexError) as e:
-                    raise ValueError(f"Invalid data format at line {line_num}: {e}") from e
+                except (ValueError, UnicodeDecodeError):
+                    continue
 
-        return matching_entries
+                index.setdefault(entry.identifier.upper(), []).append(entry)
+
+        return index
 
     @staticmethod
     def validate_file_path(file_path: str) -> Optional[str]:
@@ -104,19 +660,22 @@ class DataFileReader:
         if not file_path:
             return "No file path provided"
 
-        path = Path(file_path)
-        if not path.exists():
+        # One stat() covers existence and file-type checks; os.access then
+        # answers readability without constructing a file object
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return f"File does not exist: {file_path}"
+        except OSError as e:
+            return f"Error accessing file: {e}"
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return f"Path is not a file: {file_path}"
 
         try:
-            with open(file_path, "r", encoding="utf-8"):
-                pass
-        except PermissionError:
-            return f"No permission to read file: {file_path}"
-        except Exception as e:
+            if not os.access(file_path, os.R_OK):
+                return f"No permission to read file: {file_path}"
+        except OSError as e:
             return f"Error accessing file: {e}"
 
         return None
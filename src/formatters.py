@@ -13,6 +13,8 @@ This rounding is standard practice in aviation waypoint notation and does not
 affect the accuracy of the underlying coordinate calculations.
 """
 
+from typing import Iterable
+
 from .constants import LARGE_DISTANCE_THRESHOLD_NM, NavAidType
 from .models import FixResult, NavAidEntry, WaypointResult
 
@@ -31,53 +33,37 @@ class WaypointFormatter:
         Returns:
             Formatted output string
         """
+        # Bind every consumed field to a local up front; each branch below
+        # is then a single template evaluation over locals
         coords = result.coordinates
-        airport_region = result.airport_code[:2]
+        airport_code = result.airport_code
+        vor_identifier = result.vor_identifier
+        operation_code = result.operation_code
 
-        # Format based on distance threshold
-        if result.distance_nm > LARGE_DISTANCE_THRESHOLD_NM:
-            # Large distance format
-            rounded_distance = int(
-                round(result.distance_nm)
-            )  # Intentional rounding for aviation notation
-            output = (
-                f"{coords.latitude:.9f} {coords.longitude:.9f} "
-                f"{result.vor_identifier}{rounded_distance} "
-                f"{result.airport_code} {airport_region}"
-            )
-
-            if result.vor_identifier:
-                bearing_int = int(
-                    result.magnetic_bearing
-                )  # Intentional rounding for aviation notation
-                output += (
-                    f" {result.operation_code} "
-                    f"{result.vor_identifier}{bearing_int:03d}{rounded_distance:03d}"
-                )
-            else:
-                output += f" {result.operation_code}"
+        # Intentional rounding for aviation notation
+        bearing_int = int(result.magnetic_bearing)
+        distance_int = int(round(result.distance_nm))
 
+        if vor_identifier:
+            suffix = f" {operation_code} {vor_identifier}{bearing_int:03d}{distance_int:03d}"
         else:
-            # Small distance format (with radius designator)
-            bearing_int = int(result.magnetic_bearing)  # Intentional rounding for aviation notation
-            output = (
-                f"{coords.latitude:.9f} {coords.longitude:.9f} "
-                f"D{bearing_int:03d}{result.radius_letter} "
-                f"{result.airport_code} {airport_region}"
-            )
+            suffix = f" {operation_code}"
 
-            if result.vor_identifier:
-                distance_int = int(
-                    round(result.distance_nm)
-                )  # Intentional rounding for aviation notation
-                output += (
-                    f" {result.operation_code} "
-                    f"{result.vor_identifier}{bearing_int:03d}{distance_int:03d}"
-                )
-            else:
-                output += f" {result.operation_code}"
+        # Format based on distance threshold
+        if result.distance_nm > LARGE_DISTANCE_THRESHOLD_NM:
+            # Large distance format; {coords} reuses the cached string form
+            return (
+                f"{coords} "
+                f"{vor_identifier}{distance_int} "
+                f"{airport_code} {airport_code[:2]}{suffix}"
+            )
 
-        return output
+        # Small distance format (with radius designator)
+        return (
+            f"{coords} "
+            f"D{bearing_int:03d}{result.radius_letter} "
+            f"{airport_code} {airport_code[:2]}{suffix}"
+        )
 
 
 class FixFormatter:
@@ -98,12 +84,44 @@ class FixFormatter:
         airport_region = result.airport_code[:2]
         runway_int = int(result.runway_code)
 
+        # {coords} reuses the cached string form of the frozen dataclass
         return (
-            f"{coords.latitude:.9f} {coords.longitude:.9f} "
+            f"{coords} "
             f"{result.usage_code}{result.fix_code}{runway_int:02d} "
             f"{result.airport_code} {airport_region} {result.operation_code}"
         )
 
+    @staticmethod
+    def format_many(results: Iterable[FixResult]) -> list[str]:
+        """
+        Format a batch of fix results.
+
+        The per-result formatting is inlined with the attribute lookups and
+        the append method bound outside the loop, which is noticeably
+        cheaper than calling `format` once per result.
+
+        Args:
+            results: Fix calculation results
+
+        Returns:
+            List of formatted output strings, in input order
+        """
+        lines: list[str] = []
+        append = lines.append
+        for result in results:
+            airport_code = result.airport_code
+            append(
+                f"{result.coordinates} "
+                f"{result.usage_code}{result.fix_code}{int(result.runway_code):02d} "
+                f"{airport_code} {airport_code[:2]} {result.operation_code}"
+            )
+        return lines
+
+
+# Type code → display label with the unknown fallback baked in; one dict get
+# replaces the enum lookup plus label/None branch per entry
+_NAVAID_LABEL_BY_CODE = {member.code: member.label for member in NavAidType}
+
 
 class NavAidFormatter:
     """Formatter for navigation aid entries."""
@@ -119,20 +137,7 @@ class NavAidFormatter:
         Returns:
             Formatted display string
         """
-        # Get type label
-        type_label = "Unknown"
-        for navaid_type in NavAidType:
-            if navaid_type.code == entry.type_code:
-                type_label = navaid_type.label
-                break
-
-        # Build display text
-        display = f"{type_label} - {entry.identifier}"
-
-        # Add name if available
-        if entry.name:
-            display += f" - {entry.name}"
-        else:
-            display += " - [No name]"
+        type_label = _NAVAID_LABEL_BY_CODE.get(entry.type_code, "Unknown")
 
-        return display
+        # Single f-string per call; no intermediate concatenations
+        return f"{type_label} - {entry.identifier} - {entry.name or '[No name]'}"
@@ -2,22 +2,62 @@
 Data models for the VOR-FIX Coordinate Calculator.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Coordinates:
     """Geographic coordinates."""
 
     latitude: float
     longitude: float
+    # Cached string form; the instance is immutable, so it is computed once
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
-        return f"{self.latitude:.9f} {self.longitude:.9f}"
+        if self._str is None:
+            object.__setattr__(self, "_str", f"{self.latitude:.9f} {self.longitude:.9f}")
+        return self._str  # type: ignore[return-value]
 
 
-@dataclass
+@dataclass(slots=True)
+class CoordinatesArray:
+    """
+    Structure-of-arrays container for batches of coordinates.
+
+    Latitudes and longitudes are stored as packed float64 arrays (8 bytes per
+    value) instead of one Coordinates object per waypoint, which cuts heap
+    traffic substantially on file-import sized batches. Individual points are
+    materialized as Coordinates only on access.
+    """
+
+    latitudes: array = field(default_factory=lambda: array("d"))
+    longitudes: array = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[Coordinates]) -> "CoordinatesArray":
+        """Build a packed array from individual Coordinates objects."""
+        result = cls()
+        append_lat = result.latitudes.append
+        append_lon = result.longitudes.append
+        for coords in coordinates:
+            append_lat(coords.latitude)
+            append_lon(coords.longitude)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.latitudes)
+
+    def __getitem__(self, index: int) -> Coordinates:
+        return Coordinates(self.latitudes[index], self.longitudes[index])
+
+    def __iter__(self) -> Iterator[Coordinates]:
+        return map(Coordinates, self.latitudes, self.longitudes)
+
+
+@dataclass(slots=True)
 class WaypointInput:
     """Input data for waypoint calculation."""
 
@@ -30,7 +70,7 @@ class WaypointInput:
     vor_identifier: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WaypointResult:
     """Result of waypoint calculation."""
 
@@ -43,7 +83,7 @@ class WaypointResult:
     distance_nm: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FixInput:
     """Input data for fix calculation."""
 
@@ -55,7 +95,7 @@ class FixInput:
     airport_code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FixResult:
     """Result of fix calculation."""
 
@@ -67,7 +107,7 @@ class FixResult:
     operation_code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NavAidEntry:
     """Navigation aid entry from data file."""
 
@@ -76,7 +116,7 @@ class NavAidEntry:
     longitude: float
     identifier: str
     name: Optional[str] = None
-    raw_parts: Optional[list[str]] = None
+    raw_parts: Optional[tuple[str, ...]] = None
 
     @property
     def display_name(self) -> str:
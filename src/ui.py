@@ -3,10 +3,21 @@ User interface for the VOR-FIX Coordinate Calculator.
 """
 
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from tkinter import filedialog, messagebox, ttk
+from typing import Callable, Optional
 
 from .calculations import calculate_waypoint, get_radius_designator
-from .constants import FileType, FixType, FixUsage, OperationType
+from .constants import (
+    FIX_CODE_BY_LABEL,
+    FIX_TYPE_LABELS,
+    FIX_USAGE_CODE_BY_LABEL,
+    FIX_USAGE_LABELS,
+    OPERATION_CODE_BY_LABEL,
+    OPERATION_TYPE_LABELS,
+    FileType,
+)
 from .file_operations import DataFileReader
 from .formatters import FixFormatter, NavAidFormatter, WaypointFormatter
 from .models import FixResult, NavAidEntry, WaypointResult
@@ -34,13 +45,37 @@ class CoordinateCalculatorApp:
 
         # State variables
         self.mode_var = tk.StringVar(value="WAYPOINT")
+        self._mode_after_id: Optional[str] = None
         self.fix_file_path = ""
         self.nav_file_path = ""
         self.search_file_type = tk.StringVar(value="NAV")
 
+        # Identifier indexes cached per (file type, path); each file is
+        # parsed once and searches become dict lookups. Index builds run on
+        # a worker thread so the Tk event loop keeps pumping during the
+        # one-time parse of large files.
+        self._entry_index: dict[tuple[FileType, str], dict[str, list[NavAidEntry]]] = {}
+        self._index_futures: dict[tuple[FileType, str], Future] = {}
+        self._index_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_search: Optional[Callable[[], None]] = None
+
+        # Entry tuples are populated when each section is first built; the
+        # empty defaults make clearing an un-built section a no-op
+        self._waypoint_entries: tuple = ()
+        self._fix_entries: tuple = ()
+
         # Build UI
         self._create_widgets()
 
+        # The index worker is non-daemon; abandon any in-flight build on
+        # close so a large parse cannot keep the process alive
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Shut down background work and destroy the window."""
+        self._index_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def _create_widgets(self):
         """Create all UI widgets."""
         # Mode selection
@@ -49,15 +84,23 @@ class CoordinateCalculatorApp:
         # File selection
         self._create_file_section()
 
-        # Input section (contains both waypoint and fix frames)
-        self.input_frame = tk.Frame(self.root)
+        # Input section (contains both waypoint and fix frames). The two
+        # frames share one grid cell and mode switches toggle them with
+        # grid/grid_remove, which preserves cached geometry instead of
+        # forcing a full repack of the parent on every toggle.
+        self.input_frame = ttk.Frame(self.root)
         self.input_frame.pack(padx=10, pady=5, fill="x")
+        self.input_frame.columnconfigure(0, weight=1)
 
-        self.waypoint_frame = tk.Frame(self.input_frame)
-        self.fix_frame = tk.Frame(self.input_frame)
+        self.waypoint_frame = ttk.Frame(self.input_frame)
+        self.fix_frame = ttk.Frame(self.input_frame)
+        self.waypoint_frame.grid(row=0, column=0, pady=5, sticky="ew")
+        self.fix_frame.grid(row=0, column=0, pady=5, sticky="ew")
 
-        self._create_waypoint_section()
-        self._create_fix_section()
+        # Each section's widgets are built on first activation, so startup
+        # only pays for the mode that is actually shown
+        self._waypoint_built = False
+        self._fix_built = False
 
         # Output section
         self._create_output_section()
@@ -70,10 +113,10 @@ class CoordinateCalculatorApp:
 
     def _create_mode_section(self):
         """Create the mode selection section."""
-        frame = tk.LabelFrame(self.root, text="Mode Selection", padx=10, pady=5)
+        frame = ttk.LabelFrame(self.root, text="Mode Selection", padding=(10, 5))
         frame.pack(padx=10, pady=5, fill="x")
 
-        tk.Label(frame, text="Select Mode:").pack(side=tk.LEFT, padx=5)
+        ttk.Label(frame, text="Select Mode:").pack(side=tk.LEFT, padx=5)
 
         mode_combo = ttk.Combobox(
             frame,
@@ -83,32 +126,32 @@ class CoordinateCalculatorApp:
             width=15,
         )
         mode_combo.pack(side=tk.LEFT, padx=5)
-        self.mode_var.trace_add("write", lambda *args: self._on_mode_change())
+        self.mode_var.trace_add("write", lambda *args: self._schedule_mode_change())
 
     def _create_file_section(self):
         """Create the file selection section."""
-        frame = tk.LabelFrame(self.root, text="Data Files", padx=10, pady=5)
+        frame = ttk.LabelFrame(self.root, text="Data Files", padding=(10, 5))
         frame.pack(padx=10, pady=5, fill="x")
 
         # FIX file row
-        fix_frame = tk.Frame(frame)
+        fix_frame = ttk.Frame(frame)
         fix_frame.pack(fill="x", pady=2)
 
-        tk.Label(fix_frame, text="FIX File:", width=10, anchor="w").pack(side=tk.LEFT)
-        self.entry_fix_file = tk.Entry(fix_frame)
+        ttk.Label(fix_frame, text="FIX File:", width=10, anchor="w").pack(side=tk.LEFT)
+        self.entry_fix_file = ttk.Entry(fix_frame)
         self.entry_fix_file.pack(side=tk.LEFT, fill="x", expand=True, padx=5)
-        tk.Button(fix_frame, text="Browse", command=lambda: self._browse_file(FileType.FIX)).pack(
+        ttk.Button(fix_frame, text="Browse", command=partial(self._browse_file, FileType.FIX)).pack(
             side=tk.LEFT
         )
 
         # NAV file row
-        nav_frame = tk.Frame(frame)
+        nav_frame = ttk.Frame(frame)
         nav_frame.pack(fill="x", pady=2)
 
-        tk.Label(nav_frame, text="NAV File:", width=10, anchor="w").pack(side=tk.LEFT)
-        self.entry_nav_file = tk.Entry(nav_frame)
+        ttk.Label(nav_frame, text="NAV File:", width=10, anchor="w").pack(side=tk.LEFT)
+        self.entry_nav_file = ttk.Entry(nav_frame)
         self.entry_nav_file.pack(side=tk.LEFT, fill="x", expand=True, padx=5)
-        tk.Button(nav_frame, text="Browse", command=lambda: self._browse_file(FileType.NAV)).pack(
+        ttk.Button(nav_frame, text="Browse", command=partial(self._browse_file, FileType.NAV)).pack(
             side=tk.LEFT
         )
 
@@ -120,191 +163,204 @@ class CoordinateCalculatorApp:
         row = 0
 
         # Search file type
-        tk.Label(frame, text="Search in:", anchor="e").grid(
-            row=row, column=0, padx=5, pady=3, sticky="e"
-        )
-        search_combo = ttk.Combobox(
-            frame,
-            textvariable=self.search_file_type,
-            values=["NAV", "FIX"],
-            state="readonly",
-            width=10,
-        )
-        search_combo.grid(row=row, column=1, padx=5, pady=3, sticky="w")
+        self._make_search_combo(frame, row)
         row += 1
 
         # Identifier
-        tk.Label(frame, text="VOR/DME/NDB ID:", anchor="e").grid(
+        ttk.Label(frame, text="VOR/DME/NDB ID:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_waypoint_id = tk.Entry(frame)
+        self.entry_waypoint_id = ttk.Entry(frame)
         self.entry_waypoint_id.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        tk.Button(frame, text="Search", command=self._search_waypoint_coords).grid(
+        ttk.Button(frame, text="Search", command=self._search_waypoint_coords).grid(
             row=row, column=2, padx=5, pady=3
         )
         row += 1
 
         # Coordinates
-        tk.Label(frame, text="Coordinates (Lat Lon):", anchor="e").grid(
+        ttk.Label(frame, text="Coordinates (Lat Lon):", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_waypoint_coords = tk.Entry(frame)
+        self.entry_waypoint_coords = ttk.Entry(frame)
         self.entry_waypoint_coords.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Magnetic bearing
-        tk.Label(frame, text="Magnetic Bearing (°):", anchor="e").grid(
+        ttk.Label(frame, text="Magnetic Bearing (°):", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_bearing = tk.Entry(frame)
+        self.entry_bearing = ttk.Entry(frame)
         self.entry_bearing.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Distance
-        tk.Label(frame, text="Distance (NM):", anchor="e").grid(
+        ttk.Label(frame, text="Distance (NM):", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_distance = tk.Entry(frame)
+        self.entry_distance = ttk.Entry(frame)
         self.entry_distance.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Declination
-        tk.Label(frame, text="Mag Declination (°):", anchor="e").grid(
+        ttk.Label(frame, text="Mag Declination (°):", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_declination = tk.Entry(frame)
+        self.entry_declination = ttk.Entry(frame)
         self.entry_declination.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Airport code
-        tk.Label(frame, text="Airport Code:", anchor="e").grid(
+        ttk.Label(frame, text="Airport Code:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_airport_code = tk.Entry(frame)
+        self.entry_airport_code = ttk.Entry(frame)
         self.entry_airport_code.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # VOR identifier
-        tk.Label(frame, text="VOR Identifier:", anchor="e").grid(
+        ttk.Label(frame, text="VOR Identifier:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_vor_id = tk.Entry(frame)
+        self.entry_vor_id = ttk.Entry(frame)
         self.entry_vor_id.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Operation type
-        tk.Label(frame, text="Operation Type:", anchor="e").grid(
+        ttk.Label(frame, text="Operation Type:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
         self.combo_wp_operation = ttk.Combobox(
-            frame, values=[op.label for op in OperationType], state="readonly"
+            frame, values=OPERATION_TYPE_LABELS, state="readonly"
         )
         self.combo_wp_operation.current(0)
         self.combo_wp_operation.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Calculate button
-        tk.Button(frame, text="Calculate Waypoint", command=self._calculate_waypoint).grid(
+        ttk.Button(frame, text="Calculate Waypoint", command=self._calculate_waypoint).grid(
             row=row, column=0, columnspan=3, pady=10
         )
 
-    def _create_fix_section(self):
-        """Create the fix input section."""
-        frame = self.fix_frame
-        frame.columnconfigure(1, weight=1)
-
-        row = 0
+        # Cached for _clear_fields
+        self._waypoint_entries = (
+            self.entry_waypoint_id,
+            self.entry_waypoint_coords,
+            self.entry_bearing,
+            self.entry_distance,
+            self.entry_declination,
+            self.entry_airport_code,
+            self.entry_vor_id,
+        )
 
-        # Search file type
-        tk.Label(frame, text="Search in:", anchor="e").grid(
+    def _make_search_combo(self, frame: ttk.Frame, row: int):
+        """Create the shared search-file-type row in an input section."""
+        ttk.Label(frame, text="Search in:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
         search_combo = ttk.Combobox(
             frame,
             textvariable=self.search_file_type,
-            values=["FIX", "NAV"],
+            values=["NAV", "FIX"],
             state="readonly",
             width=10,
         )
         search_combo.grid(row=row, column=1, padx=5, pady=3, sticky="w")
+
+    def _create_fix_section(self):
+        """Create the fix input section."""
+        frame = self.fix_frame
+        frame.columnconfigure(1, weight=1)
+
+        row = 0
+
+        # Search file type
+        self._make_search_combo(frame, row)
         row += 1
 
         # FIX identifier
-        tk.Label(frame, text="FIX Identifier:", anchor="e").grid(
+        ttk.Label(frame, text="FIX Identifier:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_fix_id = tk.Entry(frame)
+        self.entry_fix_id = ttk.Entry(frame)
         self.entry_fix_id.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
-        tk.Button(frame, text="Search", command=self._search_fix_coords).grid(
+        ttk.Button(frame, text="Search", command=self._search_fix_coords).grid(
             row=row, column=2, padx=5, pady=3
         )
         row += 1
 
         # Coordinates
-        tk.Label(frame, text="Coordinates (Lat Lon):", anchor="e").grid(
+        ttk.Label(frame, text="Coordinates (Lat Lon):", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_fix_coords = tk.Entry(frame)
+        self.entry_fix_coords = ttk.Entry(frame)
         self.entry_fix_coords.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # FIX type
-        tk.Label(frame, text="FIX Type:", anchor="e").grid(
+        ttk.Label(frame, text="FIX Type:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
         self.combo_fix_type = ttk.Combobox(
-            frame, values=[ft.label for ft in FixType], state="readonly"
+            frame, values=FIX_TYPE_LABELS, state="readonly"
         )
         self.combo_fix_type.current(0)
         self.combo_fix_type.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # FIX usage
-        tk.Label(frame, text="FIX Usage:", anchor="e").grid(
+        ttk.Label(frame, text="FIX Usage:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
         self.combo_fix_usage = ttk.Combobox(
-            frame, values=[fu.label for fu in FixUsage], state="readonly"
+            frame, values=FIX_USAGE_LABELS, state="readonly"
         )
         self.combo_fix_usage.current(0)
         self.combo_fix_usage.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Runway code
-        tk.Label(frame, text="Runway Code:", anchor="e").grid(
+        ttk.Label(frame, text="Runway Code:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_runway_code = tk.Entry(frame)
+        self.entry_runway_code = ttk.Entry(frame)
         self.entry_runway_code.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Airport code
-        tk.Label(frame, text="Airport Code:", anchor="e").grid(
+        ttk.Label(frame, text="Airport Code:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
-        self.entry_fix_airport_code = tk.Entry(frame)
+        self.entry_fix_airport_code = ttk.Entry(frame)
         self.entry_fix_airport_code.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Operation type
-        tk.Label(frame, text="Operation Type:", anchor="e").grid(
+        ttk.Label(frame, text="Operation Type:", anchor="e").grid(
             row=row, column=0, padx=5, pady=3, sticky="e"
         )
         self.combo_fix_operation = ttk.Combobox(
-            frame, values=[op.label for op in OperationType], state="readonly"
+            frame, values=OPERATION_TYPE_LABELS, state="readonly"
         )
         self.combo_fix_operation.current(0)
         self.combo_fix_operation.grid(row=row, column=1, padx=5, pady=3, sticky="ew")
         row += 1
 
         # Calculate button
-        tk.Button(frame, text="Calculate FIX", command=self._calculate_fix).grid(
+        ttk.Button(frame, text="Calculate FIX", command=self._calculate_fix).grid(
             row=row, column=0, columnspan=3, pady=10
         )
 
+        # Cached for _clear_fields
+        self._fix_entries = (
+            self.entry_fix_id,
+            self.entry_fix_coords,
+            self.entry_runway_code,
+            self.entry_fix_airport_code,
+        )
+
     def _create_output_section(self):
         """Create the output display section."""
-        frame = tk.LabelFrame(self.root, text="Output Result", padx=10, pady=5)
+        frame = ttk.LabelFrame(self.root, text="Output Result", padding=(10, 5))
         frame.pack(padx=10, pady=5, fill="both", expand=True)
 
         self.output_text = tk.Text(
@@ -314,27 +370,41 @@ class CoordinateCalculatorApp:
 
     def _create_button_section(self):
         """Create the bottom button section."""
-        frame = tk.Frame(self.root)
+        frame = ttk.Frame(self.root)
         frame.pack(padx=10, pady=10, fill="x")
 
-        tk.Button(frame, text="Clear Input", command=self._clear_fields).pack(side=tk.LEFT, padx=5)
+        ttk.Button(frame, text="Clear Input", command=self._clear_fields).pack(side=tk.LEFT, padx=5)
 
-        tk.Button(frame, text="Copy Result", command=self._copy_output).pack(side=tk.LEFT, padx=5)
+        ttk.Button(frame, text="Copy Result", command=self._copy_output).pack(side=tk.LEFT, padx=5)
 
-        tk.Button(frame, text="Exit", command=self.root.quit).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(frame, text="Exit", command=self.root.quit).pack(side=tk.RIGHT, padx=5)
+
+    def _schedule_mode_change(self):
+        """Debounce mode changes so a burst of writes triggers one relayout."""
+        if self._mode_after_id is not None:
+            self.root.after_cancel(self._mode_after_id)
+        self._mode_after_id = self.root.after(30, self._on_mode_change)
 
     def _on_mode_change(self):
         """Handle mode selection change."""
+        self._mode_after_id = None
         mode = self.mode_var.get()
 
-        self.waypoint_frame.pack_forget()
-        self.fix_frame.pack_forget()
-
+        # grid_remove hides the inactive frame but keeps its grid options,
+        # so re-showing it is a visibility toggle rather than a re-layout
         if mode == "WAYPOINT":
-            self.waypoint_frame.pack(fill="x", pady=5)
+            if not self._waypoint_built:
+                self._create_waypoint_section()
+                self._waypoint_built = True
+            self.fix_frame.grid_remove()
+            self.waypoint_frame.grid()
             self.search_file_type.set("NAV")
         else:
-            self.fix_frame.pack(fill="x", pady=5)
+            if not self._fix_built:
+                self._create_fix_section()
+                self._fix_built = True
+            self.waypoint_frame.grid_remove()
+            self.fix_frame.grid()
             self.search_file_type.set("FIX")
 
     def _browse_file(self, file_type: FileType):
@@ -345,6 +415,13 @@ class CoordinateCalculatorApp:
         )
 
         if filepath:
+            # Drop cached and in-flight indexes for this file type; the file
+            # is re-read (or its sidecar cache reused) on the next search
+            for key in [cached for cached in self._entry_index if cached[0] == file_type]:
+                del self._entry_index[key]
+            for key in [pending for pending in self._index_futures if pending[0] == file_type]:
+                del self._index_futures[key]
+
             if file_type == FileType.FIX:
                 self.fix_file_path = filepath
                 self.entry_fix_file.delete(0, tk.END)
@@ -354,6 +431,46 @@ class CoordinateCalculatorApp:
                 self.entry_nav_file.delete(0, tk.END)
                 self.entry_nav_file.insert(0, filepath)
 
+    def _get_index(
+        self, file_type: FileType, file_path: str
+    ) -> Optional[dict[str, list[NavAidEntry]]]:
+        """
+        Get the identifier index for a data file, parsing it at most once.
+
+        Returns None while the index is still being built on the worker
+        thread; completion is marshalled back onto the Tk main loop.
+        """
+        key = (file_type, file_path)
+        index = self._entry_index.get(key)
+        if index is not None:
+            return index
+
+        if key not in self._index_futures:
+            future = self._index_executor.submit(DataFileReader.load_index, file_path, file_type)
+            self._index_futures[key] = future
+            future.add_done_callback(lambda _: self.root.after(0, self._on_index_ready, key))
+
+        return None
+
+    def _on_index_ready(self, key: tuple[FileType, str]):
+        """Store a finished index and re-run any search waiting on it."""
+        future = self._index_futures.pop(key, None)
+        if future is None:
+            # The path was re-browsed while the build was in flight
+            return
+
+        try:
+            self._entry_index[key] = future.result()
+        except Exception as e:
+            self._pending_search = None
+            self._set_output("")
+            messagebox.showerror("Error", str(e))
+            return
+
+        pending, self._pending_search = self._pending_search, None
+        if pending is not None:
+            pending()
+
     def _get_file_type_and_path(self) -> tuple[FileType, str]:
         """Get current file type and path based on search selection."""
         file_type_str = self.search_file_type.get()
@@ -376,8 +493,15 @@ class CoordinateCalculatorApp:
             messagebox.showerror("File Error", f"Please select a {file_type.value} file.")
             return
 
+        index = self._get_index(file_type, file_path)
+        if index is None:
+            # Re-run this search automatically once the index is built
+            self._pending_search = self._search_waypoint_coords
+            self._set_output(f"Indexing {file_path}…")
+            return
+
         try:
-            entries = DataFileReader.read_file(file_path, file_type, identifier)
+            entries = index.get(identifier, [])
 
             if not entries:
                 messagebox.showinfo("Not Found", f"Identifier '{identifier}' not found.")
@@ -404,8 +528,15 @@ class CoordinateCalculatorApp:
             messagebox.showerror("File Error", f"Please select a {file_type.value} file.")
             return
 
+        index = self._get_index(file_type, file_path)
+        if index is None:
+            # Re-run this search automatically once the index is built
+            self._pending_search = self._search_fix_coords
+            self._set_output(f"Indexing {file_path}…")
+            return
+
         try:
-            entries = DataFileReader.read_file(file_path, file_type, identifier)
+            entries = index.get(identifier, [])
 
             if not entries:
                 messagebox.showinfo("Not Found", f"Identifier '{identifier}' not found.")
@@ -422,30 +553,34 @@ class CoordinateCalculatorApp:
     def _show_entry_selection(self, entries: list[NavAidEntry], callback):
         """Show dialog for selecting from multiple entries."""
         dialog = tk.Toplevel(self.root)
+        # Build the dialog withdrawn so the geometry manager runs one final
+        # layout pass instead of remapping after every widget
+        dialog.withdraw()
         dialog.title("Select Entry")
         dialog.geometry("400x300")
         dialog.transient(self.root)
         dialog.grab_set()
 
-        tk.Label(dialog, text="Multiple entries found. Please select one:").pack(pady=10)
-
-        selected_var = tk.StringVar()
+        ttk.Label(dialog, text="Multiple entries found. Please select one:").pack(pady=10)
 
-        for i, entry in enumerate(entries):
-            display_text = NavAidFormatter.format_for_display(entry)
-            rb = tk.Radiobutton(dialog, text=display_text, variable=selected_var, value=str(i))
-            rb.pack(anchor="w", padx=20)
+        # A single Listbox stays one Tk widget no matter how many entries
+        # there are; all rows are inserted in one call
+        listbox = tk.Listbox(dialog, height=min(10, len(entries)), exportselection=False)
+        listbox.insert(tk.END, *(NavAidFormatter.format_for_display(entry) for entry in entries))
+        listbox.pack(fill="both", expand=True, padx=20)
 
         def on_confirm():
-            selection = selected_var.get()
+            selection = listbox.curselection()
             if not selection:
                 messagebox.showwarning("Selection Required", "Please select an entry.")
                 return
-            callback(entries[int(selection)])
+            callback(entries[selection[0]])
             dialog.destroy()
 
-        tk.Button(dialog, text="Confirm", command=on_confirm).pack(pady=10)
+        ttk.Button(dialog, text="Confirm", command=on_confirm).pack(pady=10)
 
+        dialog.update_idletasks()
+        dialog.deiconify()
         dialog.wait_window()
 
     def _set_waypoint_coords(self, entry: NavAidEntry):
@@ -483,12 +618,7 @@ class CoordinateCalculatorApp:
             radius_letter = get_radius_designator(distance)
 
             # Get operation code
-            op_label = self.combo_wp_operation.get()
-            op_code = ""
-            for op in OperationType:
-                if op.label == op_label:
-                    op_code = op.code
-                    break
+            op_code = OPERATION_CODE_BY_LABEL.get(self.combo_wp_operation.get(), "")
 
             # Create result
             result = WaypointResult(
@@ -522,29 +652,10 @@ class CoordinateCalculatorApp:
             runway_code = RunwayCodeValidator.parse(self.entry_runway_code.get())
             airport_code = AirportCodeValidator.parse(self.entry_fix_airport_code.get())
 
-            # Get fix type code
-            fix_type_label = self.combo_fix_type.get()
-            fix_code = ""
-            for ft in FixType:
-                if ft.label == fix_type_label:
-                    fix_code = ft.code
-                    break
-
-            # Get usage code
-            usage_label = self.combo_fix_usage.get()
-            usage_code = ""
-            for fu in FixUsage:
-                if fu.label == usage_label:
-                    usage_code = fu.code
-                    break
-
-            # Get operation code
-            op_label = self.combo_fix_operation.get()
-            op_code = ""
-            for op in OperationType:
-                if op.label == op_label:
-                    op_code = op.code
-                    break
+            # Get fix type, usage, and operation codes
+            fix_code = FIX_CODE_BY_LABEL.get(self.combo_fix_type.get(), "")
+            usage_code = FIX_USAGE_CODE_BY_LABEL.get(self.combo_fix_usage.get(), "")
+            op_code = OPERATION_CODE_BY_LABEL.get(self.combo_fix_operation.get(), "")
 
             if not fix_code or not usage_code:
                 raise ValidationError("Invalid FIX type or usage selection.")
@@ -570,34 +681,27 @@ class CoordinateCalculatorApp:
 
     def _set_output(self, text: str):
         """Set the output text."""
+        # Text.replace is a single Tcl command, vs separate delete + insert
         self.output_text.config(state=tk.NORMAL)
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, text)
+        self.output_text.replace(1.0, tk.END, text)
         self.output_text.config(state=tk.DISABLED)
 
     def _clear_fields(self):
         """Clear all input fields."""
         if self.mode_var.get() == "WAYPOINT":
-            self.entry_waypoint_id.delete(0, tk.END)
-            self.entry_waypoint_coords.delete(0, tk.END)
-            self.entry_bearing.delete(0, tk.END)
-            self.entry_distance.delete(0, tk.END)
-            self.entry_declination.delete(0, tk.END)
-            self.entry_airport_code.delete(0, tk.END)
-            self.entry_vor_id.delete(0, tk.END)
+            entries = self._waypoint_entries
         else:
-            self.entry_fix_id.delete(0, tk.END)
-            self.entry_fix_coords.delete(0, tk.END)
-            self.entry_runway_code.delete(0, tk.END)
-            self.entry_fix_airport_code.delete(0, tk.END)
+            entries = self._fix_entries
+
+        for entry in entries:
+            entry.delete(0, tk.END)
 
         self._set_output("")
 
     def _copy_output(self):
         """Copy output text to clipboard."""
-        self.output_text.config(state=tk.NORMAL)
+        # Disabled Text widgets can still be read; no state toggle needed
         text = self.output_text.get(1.0, tk.END).strip()
-        self.output_text.config(state=tk.DISABLED)
 
         if text:
             self.root.clipboard_clear()
@@ -2,6 +2,11 @@
 Input validation for the VOR-FIX Coordinate Calculator.
 """
 
+import re
+from enum import IntEnum
+from functools import lru_cache
+from typing import Callable, TypeVar
+
 from .constants import (
     AIRPORT_CODE_LENGTH,
     BEARING_MAX,
@@ -25,6 +30,78 @@ class ValidationError(Exception):
     """Custom exception for validation errors."""
 
 
+class FailCode(IntEnum):
+    """Non-raising validation outcomes for stream parsers."""
+
+    OK = 0
+    LAT_OUT_OF_RANGE = 1
+    LON_OUT_OF_RANGE = 2
+
+
+# Fast path for the common "decimal decimal" coordinate input; anything it
+# does not match (scientific notation, malformed input) falls back to the
+# split-based parse below
+_COORD_RE = re.compile(r"\s*(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s*")
+
+# Airport and VOR codes are ICAO identifiers, which are ASCII-only; a single
+# fullmatch over the character class is one C call and, unlike str.isalpha,
+# rejects non-ASCII letters
+_ASCII_ALPHA_RE = re.compile(r"[A-Za-z]+")
+
+# Range-check messages only ever interpolate constants, so they are built
+# once at import instead of on every failed validation
+_LAT_RANGE_MSG = f"Latitude must be between {LAT_MIN} and {LAT_MAX} degrees"
+_LON_RANGE_MSG = f"Longitude must be between {LON_MIN} and {LON_MAX} degrees"
+_BEARING_RANGE_MSG = f"Bearing must be between {BEARING_MIN} and {BEARING_MAX} degrees"
+_DECLINATION_RANGE_MSG = (
+    f"Declination must be between {DECLINATION_MIN} and {DECLINATION_MAX} degrees"
+)
+_DISTANCE_MSG = f"Distance must be greater than {DISTANCE_MIN} nautical miles"
+_RUNWAY_MSG = f"Runway code must be between {RUNWAY_MIN} and {RUNWAY_MAX}"
+_AIRPORT_LEN_MSG = f"Airport code must be exactly {AIRPORT_CODE_LENGTH} characters"
+_VOR_LEN_MSG = (
+    f"VOR identifier must be {VOR_IDENTIFIER_MIN_LENGTH}-"
+    f"{VOR_IDENTIFIER_MAX_LENGTH} characters"
+)
+
+
+_Numeric = TypeVar("_Numeric", float, int)
+
+
+def _parse_numeric(
+    value_str: str,
+    caster: Callable[[str], _Numeric],
+    validator: Callable[[_Numeric], None],
+    kind: str,
+) -> _Numeric:
+    """
+    Shared strip → cast → validate sequence for the scalar validators.
+
+    Args:
+        value_str: Raw input string
+        caster: Conversion callable (float or int)
+        validator: Range-check callable invoked with the converted value
+        kind: Field name used in error messages, e.g. "Bearing"
+
+    Returns:
+        The converted and validated value
+
+    Raises:
+        ValidationError: If the input is empty, unparseable, or out of range
+    """
+    value_str = value_str.strip() if value_str else ""
+    if not value_str:
+        raise ValidationError(f"{kind} cannot be empty")
+
+    try:
+        value = caster(value_str)
+    except ValueError as e:
+        raise ValidationError(f"Invalid {kind.lower()} format: {e}") from e
+
+    validator(value)
+    return value
+
+
 class CoordinateValidator:
     """Validator for geographic coordinates."""
 
@@ -40,11 +117,33 @@ class CoordinateValidator:
         Raises:
             ValidationError: If coordinates are invalid
         """
-        if not (LAT_MIN <= latitude <= LAT_MAX):
-            raise ValidationError(f"Latitude must be between {LAT_MIN} and {LAT_MAX} degrees")
+        code = CoordinateValidator.try_validate(latitude, longitude)
+        if code is FailCode.LAT_OUT_OF_RANGE:
+            raise ValidationError(_LAT_RANGE_MSG)
+        if code is FailCode.LON_OUT_OF_RANGE:
+            raise ValidationError(_LON_RANGE_MSG)
+
+    @staticmethod
+    def try_validate(latitude: float, longitude: float) -> FailCode:
+        """
+        Validate latitude and longitude without raising.
+
+        Stream parsers that expect (and skip) bad rows call this in a tight
+        loop; returning a code avoids the exception construction and unwind
+        cost of `validate` on every rejected row.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
 
+        Returns:
+            FailCode.OK if valid, otherwise the code of the failed check
+        """
+        if not (LAT_MIN <= latitude <= LAT_MAX):
+            return FailCode.LAT_OUT_OF_RANGE
         if not (LON_MIN <= longitude <= LON_MAX):
-            raise ValidationError(f"Longitude must be between {LON_MIN} and {LON_MAX} degrees")
+            return FailCode.LON_OUT_OF_RANGE
+        return FailCode.OK
 
     @staticmethod
     def parse_coordinates(coord_str: str) -> Coordinates:
@@ -60,21 +159,47 @@ class CoordinateValidator:
         Raises:
             ValidationError: If parsing or validation fails
         """
-        if not coord_str or not coord_str.strip():
+        return Coordinates(*CoordinateValidator.parse_coordinates_raw(coord_str))
+
+    @staticmethod
+    def parse_coordinates_raw(coord_str: str) -> tuple[float, float]:
+        """
+        Parse coordinates from a string into bare floats.
+
+        Batch importers that feed packed arrays use this to skip the
+        Coordinates allocation that `parse_coordinates` performs per row.
+
+        Args:
+            coord_str: String in format "latitude longitude"
+
+        Returns:
+            (latitude, longitude) tuple
+
+        Raises:
+            ValidationError: If parsing or validation fails
+        """
+        match = _COORD_RE.fullmatch(coord_str) if coord_str else None
+        if match is not None:
+            latitude = float(match.group(1))
+            longitude = float(match.group(2))
+            CoordinateValidator.validate(latitude, longitude)
+            return latitude, longitude
+
+        stripped = coord_str.strip() if coord_str else ""
+        if not stripped:
             raise ValidationError("Coordinates cannot be empty")
 
-        parts = coord_str.strip().split()
+        parts = stripped.split()
         if len(parts) != 2:
             raise ValidationError("Coordinates must be in format 'latitude longitude'")
 
         try:
-            latitude = float(parts[0])
-            longitude = float(parts[1])
+            latitude, longitude = map(float, parts)
         except ValueError as e:
             raise ValidationError(f"Invalid coordinate format: {e}") from e
 
         CoordinateValidator.validate(latitude, longitude)
-        return Coordinates(latitude, longitude)
+        return latitude, longitude
 
 
 class BearingValidator:
@@ -92,9 +217,7 @@ class BearingValidator:
             ValidationError: If bearing is invalid
         """
         if not (BEARING_MIN <= bearing <= BEARING_MAX):
-            raise ValidationError(
-                f"Bearing must be between {BEARING_MIN} and {BEARING_MAX} degrees"
-            )
+            raise ValidationError(_BEARING_RANGE_MSG)
 
     @staticmethod
     def parse(bearing_str: str) -> float:
@@ -110,21 +233,11 @@ class BearingValidator:
         Raises:
             ValidationError: If parsing or validation fails
         """
-        if not bearing_str or not bearing_str.strip():
-            raise ValidationError("Bearing cannot be empty")
-
-        try:
-            bearing = float(bearing_str.strip())
-        except ValueError as e:
-            raise ValidationError(f"Invalid bearing format: {e}") from e
-
-        BearingValidator.validate(bearing)
-
-        # Normalize 360 to 0
-        if bearing == 360.0:
-            bearing = 0.0
+        bearing = _parse_numeric(bearing_str, float, BearingValidator.validate, "Bearing")
 
-        return bearing
+        # Normalize 360 to 0; validation has already bounded the value, so a
+        # single branch-free modulo only folds the 360.0 endpoint
+        return bearing % 360.0
 
 
 class DistanceValidator:
@@ -142,7 +255,7 @@ class DistanceValidator:
             ValidationError: If distance is invalid
         """
         if distance <= DISTANCE_MIN:
-            raise ValidationError(f"Distance must be greater than {DISTANCE_MIN} nautical miles")
+            raise ValidationError(_DISTANCE_MSG)
 
     @staticmethod
     def parse(distance_str: str) -> float:
@@ -158,16 +271,7 @@ class DistanceValidator:
         Raises:
             ValidationError: If parsing or validation fails
         """
-        if not distance_str or not distance_str.strip():
-            raise ValidationError("Distance cannot be empty")
-
-        try:
-            distance = float(distance_str.strip())
-        except ValueError as e:
-            raise ValidationError(f"Invalid distance format: {e}") from e
-
-        DistanceValidator.validate(distance)
-        return distance
+        return _parse_numeric(distance_str, float, DistanceValidator.validate, "Distance")
 
 
 class DeclinationValidator:
@@ -185,9 +289,7 @@ class DeclinationValidator:
             ValidationError: If declination is invalid
         """
         if not (DECLINATION_MIN <= declination <= DECLINATION_MAX):
-            raise ValidationError(
-                f"Declination must be between {DECLINATION_MIN} and {DECLINATION_MAX} degrees"
-            )
+            raise ValidationError(_DECLINATION_RANGE_MSG)
 
     @staticmethod
     def parse(declination_str: str) -> float:
@@ -203,16 +305,39 @@ class DeclinationValidator:
         Raises:
             ValidationError: If parsing or validation fails
         """
-        if not declination_str or not declination_str.strip():
-            raise ValidationError("Declination cannot be empty")
+        return _parse_numeric(
+            declination_str, float, DeclinationValidator.validate, "Declination"
+        )
+
+
+# The identifier-style validators below see the same short strings over and
+# over (per-keystroke revalidation, batch imports), so their parse results
+# are memoized at module level; lru_cache does not compose with staticmethod,
+# hence the free functions
+@lru_cache(maxsize=4096)
+def _parse_airport_code(code_str: str) -> str:
+    code = code_str.strip().upper()
+    AirportCodeValidator.validate(code)
+    return code
 
-        try:
-            declination = float(declination_str.strip())
-        except ValueError as e:
-            raise ValidationError(f"Invalid declination format: {e}") from e
 
-        DeclinationValidator.validate(declination)
-        return declination
+@lru_cache(maxsize=4096)
+def _parse_vor_identifier(identifier_str: str, allow_empty: bool) -> str:
+    identifier = identifier_str.strip().upper()
+    VORIdentifierValidator.validate(identifier, allow_empty)
+    return identifier
+
+
+@lru_cache(maxsize=4096)
+def _parse_runway_code(code_str: str) -> int:
+    return _parse_numeric(code_str, int, RunwayCodeValidator.validate, "Runway code")
+
+
+def clear_validator_caches() -> None:
+    """Clear the memoized validator results (intended for tests)."""
+    _parse_airport_code.cache_clear()
+    _parse_vor_identifier.cache_clear()
+    _parse_runway_code.cache_clear()
 
 
 class AirportCodeValidator:
@@ -233,18 +358,20 @@ class AirportCodeValidator:
             raise ValidationError("Airport code cannot be empty")
 
         if len(code) != AIRPORT_CODE_LENGTH:
-            raise ValidationError(f"Airport code must be exactly {AIRPORT_CODE_LENGTH} characters")
+            raise ValidationError(_AIRPORT_LEN_MSG)
 
-        if not code.isalpha():
+        if _ASCII_ALPHA_RE.fullmatch(code) is None:
             raise ValidationError("Airport code must contain only letters")
 
     @staticmethod
-    def parse(code_str: str) -> str:
+    def parse(code_str: str, *, already_normalized: bool = False) -> str:
         """
         Parse and validate airport code.
 
         Args:
             code_str: Airport code string
+            already_normalized: Skip strip/uppercase when the caller has
+                already normalized the input
 
         Returns:
             Uppercase airport code
@@ -252,9 +379,10 @@ class AirportCodeValidator:
         Raises:
             ValidationError: If validation fails
         """
-        code = code_str.strip().upper()
-        AirportCodeValidator.validate(code)
-        return code
+        if already_normalized:
+            AirportCodeValidator.validate(code_str)
+            return code_str
+        return _parse_airport_code(code_str)
 
 
 class VORIdentifierValidator:
@@ -278,22 +406,23 @@ class VORIdentifierValidator:
             return
 
         if not (VOR_IDENTIFIER_MIN_LENGTH <= len(identifier) <= VOR_IDENTIFIER_MAX_LENGTH):
-            raise ValidationError(
-                f"VOR identifier must be {VOR_IDENTIFIER_MIN_LENGTH}-"
-                f"{VOR_IDENTIFIER_MAX_LENGTH} characters"
-            )
+            raise ValidationError(_VOR_LEN_MSG)
 
-        if not identifier.isalpha():
+        if _ASCII_ALPHA_RE.fullmatch(identifier) is None:
             raise ValidationError("VOR identifier must contain only letters")
 
     @staticmethod
-    def parse(identifier_str: str, allow_empty: bool = True) -> str:
+    def parse(
+        identifier_str: str, allow_empty: bool = True, *, already_normalized: bool = False
+    ) -> str:
         """
         Parse and validate VOR identifier.
 
         Args:
             identifier_str: VOR identifier string
             allow_empty: Whether empty identifier is allowed
+            already_normalized: Skip strip/uppercase when the caller has
+                already normalized the input
 
         Returns:
             Uppercase VOR identifier
@@ -301,9 +430,10 @@ class VORIdentifierValidator:
         Raises:
             ValidationError: If validation fails
         """
-        identifier = identifier_str.strip().upper()
-        VORIdentifierValidator.validate(identifier, allow_empty)
-        return identifier
+        if already_normalized:
+            VORIdentifierValidator.validate(identifier_str, allow_empty)
+            return identifier_str
+        return _parse_vor_identifier(identifier_str, allow_empty)
 
 
 class RunwayCodeValidator:
@@ -321,7 +451,7 @@ class RunwayCodeValidator:
             ValidationError: If code is invalid
         """
         if not (RUNWAY_MIN <= code <= RUNWAY_MAX):
-            raise ValidationError(f"Runway code must be between {RUNWAY_MIN} and {RUNWAY_MAX}")
+            raise ValidationError(_RUNWAY_MSG)
 
     @staticmethod
     def parse(code_str: str) -> int:
@@ -337,13 +467,4 @@ class RunwayCodeValidator:
         Raises:
             ValidationError: If parsing or validation fails
         """
-        if not code_str or not code_str.strip():
-            raise ValidationError("Runway code cannot be empty")
-
-        try:
-            code = int(code_str.strip())
-        except ValueError as e:
-            raise ValidationError(f"Invalid runway code format: {e}") from e
-
-        RunwayCodeValidator.validate(code)
-        return code
+        return _parse_runway_code(code_str)
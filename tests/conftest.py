@@ -0,0 +1,100 @@
+"""
+Shared fixtures for the test suite.
+
+Canonical valid inputs are parsed once per session and injected where a
+test only needs the result, instead of re-running the same parse in
+every test body.
+"""
+
+import pytest
+
+from src.validators import (
+    AirportCodeValidator,
+    BearingValidator,
+    CoordinateValidator,
+    DistanceValidator,
+    RunwayCodeValidator,
+    VORIdentifierValidator,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_parser_caches():
+    """Prime the memoized parse helpers once before the first test.
+
+    Parsing the canonical inputs up front means tests exercising the
+    cached fast paths measure warm-cache behavior regardless of
+    execution order.
+    """
+    AirportCodeValidator.parse("ksfo")
+    VORIdentifierValidator.parse("sfo")
+    RunwayCodeValidator.parse("18")
+
+
+# Canonical NAV corpus shared by read-only reader tests; the OAK row names
+# SFO in its name column so substring hits are exercised on every search
+NAV_CORPUS = (
+    "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+    "12 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO DME\n"
+    "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+    "3 37.72 -122.22 0 11690 100 0.0 OAK SFO-NAMED VOR\n"
+)
+
+
+@pytest.fixture(scope="session")
+def nav_corpus(tmp_path_factory):
+    """Write the canonical NAV corpus once per test run."""
+    nav_file = tmp_path_factory.mktemp("nav_corpus") / "nav.dat"
+    nav_file.write_text(NAV_CORPUS)
+    return str(nav_file)
+
+
+# Table of (input, expected value, expected error substring) bearing cases;
+# pytest_generate_tests expands it into one parametrized node per row
+BEARING_CASES = [
+    ("0", 0.0, None),
+    ("180.5", 180.5, None),
+    ("360", 0.0, None),  # endpoint folds to zero
+    ("-1", None, "Bearing must be between"),
+    ("361", None, "Bearing must be between"),
+    ("abc", None, "Invalid bearing format"),
+    ("", None, "Bearing cannot be empty"),
+]
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize tests that consume the shared case tables."""
+    if "bearing_case" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "bearing_case", BEARING_CASES, ids=[case[0] or "blank" for case in BEARING_CASES]
+        )
+
+
+@pytest.fixture(scope="session")
+def sfo_coords():
+    """Parsed canonical coordinate string."""
+    return CoordinateValidator.parse_coordinates("37.6213 -122.3790")
+
+
+@pytest.fixture(scope="session")
+def parsed_airport_code():
+    """Parsed canonical airport code."""
+    return AirportCodeValidator.parse("ksfo")
+
+
+@pytest.fixture(scope="session")
+def parsed_vor_identifier():
+    """Parsed canonical VOR identifier."""
+    return VORIdentifierValidator.parse("sfo")
+
+
+@pytest.fixture(scope="session")
+def parsed_bearing():
+    """Parsed canonical bearing string."""
+    return BearingValidator.parse("180")
+
+
+@pytest.fixture(scope="session")
+def parsed_distance():
+    """Parsed canonical distance string."""
+    return DistanceValidator.parse("10.5")
@@ -6,125 +6,121 @@ import pytest
 
 from src.calculations import (
     calculate_destination_point,
+    calculate_destination_point_spherical,
+    calculate_destination_points,
+    calculate_destination_points_array,
     calculate_waypoint,
     get_radius_designator,
+    get_radius_designators,
     magnetic_to_true_bearing,
 )
-from src.models import Coordinates
+from src.models import Coordinates, CoordinatesArray
+
+# Shared immutable origins; Coordinates is frozen, so a single instance is
+# safe to reuse across tests
+SFO = Coordinates(latitude=37.6213, longitude=-122.3790)
+BAY_AREA = Coordinates(latitude=37.0, longitude=-122.0)
 
 
 class TestMagneticToTrueBearing:
     """Tests for magnetic_to_true_bearing function."""
 
-    def test_positive_declination(self):
-        """Test conversion with positive declination."""
-        result = magnetic_to_true_bearing(90.0, 15.0)
-        assert result == 105.0
-
-    def test_negative_declination(self):
-        """Test conversion with negative declination."""
-        result = magnetic_to_true_bearing(90.0, -15.0)
-        assert result == 75.0
-
-    def test_zero_declination(self):
-        """Test conversion with zero declination."""
-        result = magnetic_to_true_bearing(90.0, 0.0)
-        assert result == 90.0
-
-    def test_wrapping_over_360(self):
-        """Test that result wraps around at 360 degrees."""
-        result = magnetic_to_true_bearing(350.0, 20.0)
-        assert result == 10.0
-
-    def test_wrapping_below_zero(self):
-        """Test that result wraps around below 0."""
-        result = magnetic_to_true_bearing(10.0, -20.0)
-        assert result == 350.0
+    @pytest.mark.parametrize(
+        "bearing,declination,expected",
+        [
+            (90.0, 15.0, 105.0),  # positive declination
+            (90.0, -15.0, 75.0),  # negative declination
+            (90.0, 0.0, 90.0),  # zero declination
+            (350.0, 20.0, 10.0),  # wraps over 360
+            (10.0, -20.0, 350.0),  # wraps below zero
+        ],
+    )
+    def test_conversion(self, bearing, declination, expected):
+        """Test conversion across declinations, including wrap-around."""
+        assert magnetic_to_true_bearing(bearing, declination) == expected
+
+    def test_matches_modulo_over_valid_ranges(self):
+        """Test that the result matches % 360 across the validated input ranges."""
+        for tenth_bearing in range(0, 3600, 73):
+            for tenth_declination in range(-1800, 1801, 97):
+                bearing = tenth_bearing / 10.0
+                declination = tenth_declination / 10.0
+                expected = (bearing + declination) % 360.0
+                assert magnetic_to_true_bearing(bearing, declination) == expected
 
 
 class TestGetRadiusDesignator:
     """Tests for get_radius_designator function."""
 
-    def test_letter_a_low(self):
-        """Test lower bound of letter A range."""
-        assert get_radius_designator(0.1) == "A"
-
-    def test_letter_a_high(self):
-        """Test upper bound of letter A range."""
-        assert get_radius_designator(1.4) == "A"
-
-    def test_letter_a_middle(self):
-        """Test middle of letter A range."""
-        assert get_radius_designator(0.8) == "A"
-
-    def test_letter_b(self):
-        """Test letter B range."""
-        assert get_radius_designator(2.0) == "B"
-
-    def test_letter_d(self):
-        """Test letter D range."""
-        assert get_radius_designator(4.0) == "D"
-
-    def test_letter_m(self):
-        """Test letter M range."""
-        assert get_radius_designator(13.0) == "M"
-
-    def test_letter_z_in_range(self):
-        """Test letter Z within range."""
-        assert get_radius_designator(26.0) == "Z"
-
-    def test_distance_over_max_returns_z(self):
-        """Test that distances over max range return Z."""
-        assert get_radius_designator(30.0) == "Z"
-        assert get_radius_designator(100.0) == "Z"
-
-    def test_distance_below_min_returns_z(self):
-        """Test that distances below min range return Z."""
-        assert get_radius_designator(0.05) == "Z"
+    @pytest.mark.parametrize(
+        "distance,expected",
+        [
+            (0.1, "A"),  # lower bound of A
+            (0.8, "A"),  # middle of A
+            (1.4, "A"),  # upper bound of A
+            (2.0, "B"),
+            (4.0, "D"),
+            (13.0, "M"),
+            (26.0, "Z"),  # Z within range
+            (30.0, "Z"),  # over max
+            (100.0, "Z"),  # far over max
+            (0.05, "Z"),  # below min
+            (1.45, "Z"),  # gap between A and B
+            (25.45, "Z"),  # gap between Y and Z
+            (float("inf"), "Z"),  # non-finite falls to the fallback
+            (float("-inf"), "Z"),
+            (float("nan"), "Z"),
+        ],
+    )
+    def test_designator(self, distance, expected):
+        """Test designator lookup across ranges, bounds, and gaps."""
+        assert get_radius_designator(distance) == expected
+
+    def test_batch_matches_scalar(self):
+        """Test that the batch helper matches the scalar lookup."""
+        distances = [0.1, 0.8, 2.0, 13.0, 26.0, 30.0]
+        expected = [get_radius_designator(distance) for distance in distances]
+        assert get_radius_designators(distances) == expected
+
+    def test_matches_linear_scan_over_all_ranges(self):
+        """Test that every legacy range returns the same letter as a table scan."""
+        from src.constants import RADIUS_RANGES
+
+        for low, high, letter in RADIUS_RANGES:
+            assert get_radius_designator(low) == letter
+            assert get_radius_designator(high) == letter
+            assert get_radius_designator((low + high) / 2) == letter
 
 
 class TestCalculateDestinationPoint:
     """Tests for calculate_destination_point function."""
 
-    def test_north_direction(self):
-        """Test calculation going due north."""
-        origin = Coordinates(latitude=37.0, longitude=-122.0)
-        result = calculate_destination_point(origin, azimuth=0.0, distance_nm=60.0)
-
-        # Going north should increase latitude, keep longitude similar
-        assert result.latitude > origin.latitude
-        assert abs(result.longitude - origin.longitude) < 0.1
-
-    def test_east_direction(self):
-        """Test calculation going due east."""
-        origin = Coordinates(latitude=37.0, longitude=-122.0)
-        result = calculate_destination_point(origin, azimuth=90.0, distance_nm=60.0)
-
-        # Going east should increase longitude, keep latitude similar
-        assert result.longitude > origin.longitude
-        assert abs(result.latitude - origin.latitude) < 0.1
-
-    def test_south_direction(self):
-        """Test calculation going due south."""
-        origin = Coordinates(latitude=37.0, longitude=-122.0)
-        result = calculate_destination_point(origin, azimuth=180.0, distance_nm=60.0)
-
-        # Going south should decrease latitude, keep longitude similar
-        assert result.latitude < origin.latitude
-        assert abs(result.longitude - origin.longitude) < 0.1
-
-    def test_west_direction(self):
-        """Test calculation going due west."""
-        origin = Coordinates(latitude=37.0, longitude=-122.0)
-        result = calculate_destination_point(origin, azimuth=270.0, distance_nm=60.0)
-
-        # Going west should decrease longitude, keep latitude similar
-        assert result.longitude < origin.longitude
-        assert abs(result.latitude - origin.latitude) < 0.1
+    @pytest.mark.parametrize(
+        "azimuth,lat_sign,lon_sign",
+        [
+            (0.0, 1, 0),  # north: latitude increases
+            (90.0, 0, 1),  # east: longitude increases
+            (180.0, -1, 0),  # south: latitude decreases
+            (270.0, 0, -1),  # west: longitude decreases
+        ],
+    )
+    def test_cardinal_directions(self, azimuth, lat_sign, lon_sign):
+        """Test that cardinal azimuths move the expected coordinate."""
+        origin = BAY_AREA
+        result = calculate_destination_point(origin, azimuth=azimuth, distance_nm=60.0)
+
+        lat_delta = result.latitude - origin.latitude
+        lon_delta = result.longitude - origin.longitude
+        if lat_sign:
+            assert lat_delta * lat_sign > 0
+            assert abs(lon_delta) < 0.1
+        else:
+            assert lon_delta * lon_sign > 0
+            assert abs(lat_delta) < 0.1
 
     def test_zero_distance(self):
         """Test calculation with zero distance returns same point."""
-        origin = Coordinates(latitude=37.0, longitude=-122.0)
+        origin = BAY_AREA
         result = calculate_destination_point(origin, azimuth=45.0, distance_nm=0.0)
 
         assert abs(result.latitude - origin.latitude) < 0.000001
@@ -132,7 +128,7 @@ class TestCalculateDestinationPoint:
 
     def test_known_distance_calculation(self):
         """Test calculation with known distance produces reasonable result."""
-        origin = Coordinates(latitude=37.6213, longitude=-122.3790)
+        origin = SFO
         # Calculate 10 NM at 45 degrees
         result = calculate_destination_point(origin, azimuth=45.0, distance_nm=10.0)
 
@@ -147,34 +143,128 @@ class TestCalculateDestinationPoint:
         assert lon_diff > 0.05  # Significant change
 
 
+class TestCalculateDestinationPointSpherical:
+    """Tests for calculate_destination_point_spherical function."""
+
+    def test_close_to_ellipsoidal_result(self):
+        """Test that the spherical approximation stays near the WGS84 result."""
+        origin = SFO
+
+        for azimuth in (0.0, 45.0, 90.0, 180.0, 270.0):
+            for distance in (1.0, 10.0, 30.0):
+                spherical = calculate_destination_point_spherical(origin, azimuth, distance)
+                ellipsoidal = calculate_destination_point(origin, azimuth, distance)
+
+                # Spherical-earth error grows with distance but stays well
+                # under a tenth of a nautical mile at approach-fix ranges
+                assert abs(spherical.latitude - ellipsoidal.latitude) < 0.002
+                assert abs(spherical.longitude - ellipsoidal.longitude) < 0.002
+
+    def test_zero_distance(self):
+        """Test that zero distance returns the origin."""
+        origin = BAY_AREA
+        result = calculate_destination_point_spherical(origin, azimuth=45.0, distance_nm=0.0)
+
+        assert abs(result.latitude - origin.latitude) < 0.000001
+        assert abs(result.longitude - origin.longitude) < 0.000001
+
+    def test_longitude_wraps_at_antimeridian(self):
+        """Test that longitudes wrap into the [-180, 180) range."""
+        origin = Coordinates(latitude=0.0, longitude=179.9)
+        result = calculate_destination_point_spherical(origin, azimuth=90.0, distance_nm=30.0)
+
+        assert -180.0 <= result.longitude < 180.0
+        assert result.longitude < 0  # Crossed the antimeridian
+
+
+class TestCalculateDestinationPoints:
+    """Tests for calculate_destination_points function."""
+
+    def test_matches_scalar_results(self):
+        """Test that batch results match the scalar API point-for-point."""
+        origins = [BAY_AREA, SFO]
+        azimuths = [0.0, 45.0]
+        distances = [60.0, 10.0]
+
+        batch = calculate_destination_points(origins, azimuths, distances)
+
+        assert len(batch) == 2
+        for result, origin, azimuth, distance in zip(batch, origins, azimuths, distances):
+            expected = calculate_destination_point(origin, azimuth, distance)
+            assert abs(result.latitude - expected.latitude) < 1e-12
+            assert abs(result.longitude - expected.longitude) < 1e-12
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty list."""
+        assert calculate_destination_points([], [], []) == []
+
+    def test_mismatched_lengths_raise(self):
+        """Test that mismatched input lengths raise ValueError."""
+        origins = [BAY_AREA]
+
+        with pytest.raises(ValueError, match="same length"):
+            calculate_destination_points(origins, [0.0, 90.0], [10.0])
+
+
+class TestCalculateDestinationPointsArray:
+    """Tests for calculate_destination_points_array function."""
+
+    def test_matches_scalar_results(self):
+        """Test that SoA batch results match the scalar API point-for-point."""
+        origins = [BAY_AREA, SFO]
+        azimuths = [0.0, 45.0]
+        distances = [60.0, 10.0]
+
+        batch = calculate_destination_points_array(
+            CoordinatesArray.from_coordinates(origins), azimuths, distances
+        )
+
+        assert len(batch) == 2
+        for index, (origin, azimuth, distance) in enumerate(zip(origins, azimuths, distances)):
+            expected = calculate_destination_point(origin, azimuth, distance)
+            assert abs(batch[index].latitude - expected.latitude) < 1e-12
+            assert abs(batch[index].longitude - expected.longitude) < 1e-12
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty array."""
+        assert len(calculate_destination_points_array(CoordinatesArray(), [], [])) == 0
+
+    def test_mismatched_lengths_raise(self):
+        """Test that mismatched input lengths raise ValueError."""
+        origins = CoordinatesArray.from_coordinates([BAY_AREA])
+
+        with pytest.raises(ValueError, match="same length"):
+            calculate_destination_points_array(origins, [0.0, 90.0], [10.0])
+
+
 class TestCalculateWaypoint:
     """Tests for calculate_waypoint function."""
 
     def test_with_positive_declination(self):
         """Test waypoint calculation with positive declination."""
-        origin = Coordinates(latitude=37.6213, longitude=-122.3790)
+        origin = SFO
         result = calculate_waypoint(
             origin=origin, magnetic_bearing=90.0, distance_nm=10.0, declination=15.0
         )
 
         # True bearing would be 105 (90 + 15), so should move east-southeast
         assert result.longitude > origin.longitude
-        assert isinstance(result, Coordinates)
+        assert type(result) is Coordinates
 
     def test_with_negative_declination(self):
         """Test waypoint calculation with negative declination."""
-        origin = Coordinates(latitude=37.6213, longitude=-122.3790)
+        origin = SFO
         result = calculate_waypoint(
             origin=origin, magnetic_bearing=90.0, distance_nm=10.0, declination=-15.0
         )
 
         # True bearing would be 75 (90 - 15), so should move east-northeast
         assert result.longitude > origin.longitude
-        assert isinstance(result, Coordinates)
+        assert type(result) is Coordinates
 
     def test_with_zero_declination(self):
         """Test waypoint calculation with zero declination."""
-        origin = Coordinates(latitude=37.6213, longitude=-122.3790)
+        origin = SFO
         result = calculate_waypoint(
             origin=origin, magnetic_bearing=90.0, distance_nm=10.0, declination=0.0
         )
@@ -185,11 +275,11 @@ class TestCalculateWaypoint:
 
     def test_wrapping_declination(self):
         """Test waypoint calculation with declination that causes wrapping."""
-        origin = Coordinates(latitude=37.6213, longitude=-122.3790)
+        origin = SFO
         result = calculate_waypoint(
             origin=origin, magnetic_bearing=350.0, distance_nm=10.0, declination=20.0
         )
 
         # True bearing would be 10 (350 + 20 % 360), so should move north-northeast
         assert result.latitude > origin.latitude
-        assert isinstance(result, Coordinates)
+        assert type(result) is Coordinates
@@ -11,9 +11,13 @@ from src.constants import (
     DECLINATION_MAX,
     DECLINATION_MIN,
     DISTANCE_MIN,
+    FIX_CODE_BY_LABEL,
     FIX_FILE_IDENTIFIER_INDEX,
     FIX_FILE_LAT_INDEX,
     FIX_FILE_LON_INDEX,
+    FIX_TYPE_LABELS,
+    FIX_USAGE_CODE_BY_LABEL,
+    FIX_USAGE_LABELS,
     LARGE_DISTANCE_THRESHOLD_NM,
     LAT_MAX,
     LAT_MIN,
@@ -24,6 +28,8 @@ from src.constants import (
     NAV_FILE_LAT_INDEX,
     NAV_FILE_LON_INDEX,
     NAV_FILE_TENTH_PART_INDEX,
+    OPERATION_CODE_BY_LABEL,
+    OPERATION_TYPE_LABELS,
     RADIUS_RANGES,
     RUNWAY_MAX,
     RUNWAY_MIN,
@@ -86,7 +92,7 @@ class TestRadiusRanges:
 
     def test_radius_ranges_structure(self):
         """Test that radius ranges are properly structured."""
-        assert isinstance(RADIUS_RANGES, list)
+        assert isinstance(RADIUS_RANGES, tuple)
         assert len(RADIUS_RANGES) == 26  # A-Z
 
     def test_radius_ranges_letters(self):
@@ -262,6 +268,31 @@ class TestNavAidType:
         types = list(NavAidType)
         assert len(types) == 7
 
+    def test_navaid_type_by_code(self):
+        """Test looking up navaid types by data file code."""
+        for navaid_type in NavAidType:
+            assert NavAidType.by_code(navaid_type.code) is navaid_type
+
+    def test_navaid_type_by_code_unknown(self):
+        """Test that unknown codes return None."""
+        assert NavAidType.by_code("99") is None
+
+
+class TestPrecomputedEnumViews:
+    """Tests for the precomputed label/code views."""
+
+    def test_label_tuples_match_enums(self):
+        """Test that the label tuples mirror the enum definitions in order."""
+        assert OPERATION_TYPE_LABELS == tuple(member.label for member in OperationType)
+        assert FIX_TYPE_LABELS == tuple(member.label for member in FixType)
+        assert FIX_USAGE_LABELS == tuple(member.label for member in FixUsage)
+
+    def test_code_by_label_maps_match_enums(self):
+        """Test that the label → code maps mirror the enum definitions."""
+        assert OPERATION_CODE_BY_LABEL == {m.label: m.code for m in OperationType}
+        assert FIX_CODE_BY_LABEL == {m.label: m.code for m in FixType}
+        assert FIX_USAGE_CODE_BY_LABEL == {m.label: m.code for m in FixUsage}
+
 
 class TestFileType:
     """Tests for FileType enum."""
@@ -2,72 +2,109 @@
 Test suite for the file_operations module.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from src.constants import FileType
-from src.file_operations import DataFileReader
-from src.models import NavAidEntry
+from src.file_operations import INDEX_SIDECAR_SUFFIX, DataFileReader
 
 
 class TestDataFileReader:
     """Tests for DataFileReader class."""
 
-    def test_read_nav_file_with_matching_identifier(self, tmp_path):
+    def test_file_schemas_cover_every_file_type(self):
+        """Test that the dispatch table resolves every FileType member."""
+        from src.file_operations import _FILE_SCHEMAS
+
+        for file_type in FileType:
+            lat_idx, lon_idx, id_idx, name_idx, min_parts, max_tokens = _FILE_SCHEMAS[file_type]
+            assert min_parts == max(lat_idx, lon_idx, id_idx)
+            assert max_tokens > min_parts
+
+    @pytest.mark.parametrize(
+        "identifier,expected_count",
+        [
+            ("SFO", 2),  # VOR and DME rows; the OAK row naming SFO is no match
+            ("sfo", 2),  # search is case-insensitive
+            ("SAC", 1),
+            ("OAK", 1),
+            ("LAX", 0),
+        ],
+    )
+    def test_read_nav_file_match_counts(self, nav_corpus, identifier, expected_count):
+        """Test match counts across identifiers, case, and substring traps."""
+        results = DataFileReader.read_file(nav_corpus, FileType.NAV, identifier)
+
+        assert len(results) == expected_count
+
+    def test_read_nav_file_with_matching_identifier(self, nav_corpus):
         """Test reading NAV file with matching identifier."""
-        # Create test NAV file
+        results = DataFileReader.read_file(nav_corpus, FileType.NAV, "SAC")
+
+        assert len(results) == 1
+        assert results[0].identifier == "SAC"
+        assert results[0].latitude == 38.5
+        assert results[0].longitude == -121.5
+        assert results[0].type_code == "3"
+        assert results[0].name == "VOR"
+
+    def test_read_nav_file_lowercase_file_content(self, tmp_path):
+        """Test that lowercase identifiers in the file still match."""
         nav_file = tmp_path / "test_nav.dat"
-        nav_file.write_text(
-            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
-            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
-        )
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 sfo SAN-FRANCISCO VOR\n")
 
-        # Read file
         results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
 
         assert len(results) == 1
-        assert results[0].identifier == "SFO"
-        assert results[0].latitude == 37.6213
-        assert results[0].longitude == -122.3790
-        assert results[0].type_code == "3"
-        assert results[0].name == "VOR"
+        assert results[0].identifier == "sfo"
 
-    def test_read_nav_file_case_insensitive(self, tmp_path):
-        """Test that identifier search is case-insensitive."""
+    def test_read_nav_file_mixed_case_file_content(self, tmp_path):
+        """Test that mixed-case identifiers in the file still match."""
         nav_file = tmp_path / "test_nav.dat"
-        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SfO SAN-FRANCISCO VOR\n")
 
-        # Search with lowercase
         results = DataFileReader.read_file(str(nav_file), FileType.NAV, "sfo")
 
         assert len(results) == 1
-        assert results[0].identifier == "SFO"
+        assert results[0].identifier == "SfO"
 
-    def test_read_nav_file_multiple_matches(self, tmp_path):
-        """Test reading NAV file with multiple matching identifiers."""
+    def test_iter_matches_is_lazy(self, nav_corpus):
+        """Test that iter_matches yields entries without materializing a list."""
+        matches = DataFileReader.iter_matches(nav_corpus, FileType.NAV, "SFO")
+
+        first = next(matches)
+        assert first.identifier == "SFO"
+        assert first.type_code == "3"
+        # The second match is still pending; dropping the generator here
+        # abandons the rest of the scan
+        matches.close()
+
+    def test_iter_matches_agrees_with_read_file(self, nav_corpus):
+        """Test that consuming iter_matches equals the read_file result."""
+        lazy = list(DataFileReader.iter_matches(nav_corpus, FileType.NAV, "SFO"))
+
+        assert lazy == DataFileReader.read_file(nav_corpus, FileType.NAV, "SFO")
+
+    def test_read_nav_file_skips_decoding_non_matching_lines(self, tmp_path):
+        """Test that undecodable bytes on non-matching lines are never decoded."""
         nav_file = tmp_path / "test_nav.dat"
-        nav_file.write_text(
-            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
-            "12 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO DME\n"
+        nav_file.write_bytes(
+            b"3 40.0000 -100.0000 0 11200 130 0.0 XYZ \xff\xfe-BROKEN VOR\n"
+            b"3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
         )
 
         results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
 
+        assert len(results) == 1
+        assert results[0].identifier == "SFO"
+
+    def test_read_nav_file_multiple_matches(self, nav_corpus):
+        """Test reading NAV file with multiple matching identifiers."""
+        results = DataFileReader.read_file(nav_corpus, FileType.NAV, "SFO")
+
         assert len(results) == 2
         assert results[0].type_code == "3"
         assert results[1].type_code == "12"
 
-    def test_read_nav_file_no_matches(self, tmp_path):
-        """Test reading NAV file with no matching identifier."""
-        nav_file = tmp_path / "test_nav.dat"
-        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
-
-        results = DataFileReader.read_file(str(nav_file), FileType.NAV, "LAX")
-
-        assert len(results) == 0
-
     def test_read_nav_file_skips_empty_lines(self, tmp_path):
         """Test that empty lines are skipped."""
         nav_file = tmp_path / "test_nav.dat"
@@ -91,6 +128,19 @@ class TestDataFileReader:
 
         assert len(results) == 1
 
+    def test_read_nav_file_without_trailing_newline(self, tmp_path):
+        """Test that the final line is read when the file lacks a newline."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR"
+        )
+
+        results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+
+        assert len(results) == 1
+        assert results[0].identifier == "SFO"
+
     def test_read_fix_file_with_matching_identifier(self, tmp_path):
         """Test reading FIX file with matching identifier."""
         fix_file = tmp_path / "test_fix.dat"
@@ -106,6 +156,24 @@ class TestDataFileReader:
         assert results[0].longitude == -122.3790
         assert results[0].name is None  # FIX files don't have names at index 9
 
+    def test_read_empty_file(self, tmp_path):
+        """Test that an empty file yields no entries."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("")
+
+        results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+
+        assert len(results) == 0
+
+    def test_read_nav_file_identifier_as_substring_only(self, tmp_path):
+        """Test that a substring hit elsewhere on the line is not a match."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 OAK SFO-NAMED VOR\n")
+
+        results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+
+        assert len(results) == 0
+
     def test_read_fix_file_no_matches(self, tmp_path):
         """Test reading FIX file with no matching identifier."""
         fix_file = tmp_path / "test_fix.dat"
@@ -128,6 +196,202 @@ class TestDataFileReader:
         with pytest.raises(ValueError, match="Invalid data format"):
             DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
 
+    def test_read_file_error_reports_line_number(self, tmp_path):
+        """Test that the parse error names the offending line."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+            "3 INVALID -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+        )
+
+        with pytest.raises(ValueError, match="at line 2"):
+            DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+
+    def test_parallel_scan_matches_serial_results(self, tmp_path, monkeypatch):
+        """Test that the multi-process scan returns the same entries as serial."""
+        import src.file_operations as file_operations
+
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+            "12 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO DME\n"
+        )
+
+        serial = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+
+        monkeypatch.setattr(file_operations, "PARALLEL_SCAN_THRESHOLD_BYTES", 1)
+        parallel = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+
+        assert parallel == serial
+        assert len(parallel) == 2
+
+    def test_scan_chunk_owns_lines_starting_in_range(self, tmp_path):
+        """Test that chunk workers split cleanly on line boundaries."""
+        from src.file_operations import _scan_chunk
+
+        nav_file = tmp_path / "test_nav.dat"
+        line1 = "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+        line2 = "3 38.5 -121.5 0 11650 100 0.0 SFO SACRAMENTO VOR\n"
+        nav_file.write_text(line1 + line2)
+        split = len(line1) // 2  # Mid-line split
+
+        first = _scan_chunk(str(nav_file), 0, split, FileType.NAV, b"SFO", False)
+        second = _scan_chunk(str(nav_file), split, len(line1 + line2), FileType.NAV, b"SFO", False)
+
+        # The first worker owns line 1 in full; the second owns line 2
+        assert len(first) == 1
+        assert first[0].latitude == 37.6213
+        assert len(second) == 1
+        assert second[0].latitude == 38.5
+
+    def test_scan_chunk_reports_line_number_on_error(self, tmp_path):
+        """Test that chunk workers report absolute line numbers in errors."""
+        from src.file_operations import _scan_chunk
+
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+            "3 INVALID -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+        )
+        size = nav_file.stat().st_size
+
+        with pytest.raises(ValueError, match="Invalid data format at line 2"):
+            _scan_chunk(str(nav_file), 0, size, FileType.NAV, b"SFO", False)
+
+    def test_read_file_multi_single_pass(self, tmp_path):
+        """Test searching several identifiers in one pass."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+            "3 33.9 -118.4 0 11330 100 0.0 LAX LOS-ANGELES VOR\n"
+        )
+
+        results = DataFileReader.read_file_multi(str(nav_file), FileType.NAV, ["sfo", "LAX", "JFK"])
+
+        assert set(results) == {"SFO", "LAX", "JFK"}
+        assert len(results["SFO"]) == 1
+        assert results["SFO"][0].latitude == 37.6213
+        assert len(results["LAX"]) == 1
+        assert results["JFK"] == []
+
+    def test_read_file_multi_empty_identifiers(self, tmp_path):
+        """Test that an empty identifier set skips the scan."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+
+        results = DataFileReader.read_file_multi(str(nav_file), FileType.NAV, [])
+
+        assert results == {}
+
+    def test_read_file_multi_missing_file(self):
+        """Test that FileNotFoundError is raised for non-existent file."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            DataFileReader.read_file_multi("/nonexistent/file.dat", FileType.NAV, ["SFO"])
+
+    def test_load_index_builds_full_mapping(self, tmp_path):
+        """Test that load_index maps every identifier in the file."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+        )
+
+        index = DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        assert set(index) == {"SFO", "SAC"}
+        assert index["SFO"][0].latitude == 37.6213
+
+    def test_load_index_writes_and_reuses_sidecar(self, tmp_path):
+        """Test that the sidecar cache is created and reused when fresh."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+        sidecar = tmp_path / ("test_nav.dat" + INDEX_SIDECAR_SUFFIX)
+
+        first = DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        assert sidecar.exists()
+
+        second = DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        assert second == first
+
+    def test_load_index_memoizes_in_process(self, tmp_path):
+        """Test that an unchanged file returns the memoized index object."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+
+        first = DataFileReader.load_index(str(nav_file), FileType.NAV)
+        second = DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        assert second is first
+
+    def test_load_index_rebuilds_on_stale_sidecar(self, tmp_path):
+        """Test that a sidecar stamped for older file contents is ignored."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+
+        DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        # Grow the file so the stamped size no longer matches
+        nav_file.write_text(
+            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+        )
+
+        index = DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        assert "SAC" in index
+
+    def test_load_index_rebuilds_on_corrupt_sidecar(self, tmp_path):
+        """Test that a corrupt sidecar falls back to a rebuild."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+        sidecar = tmp_path / ("test_nav.dat" + INDEX_SIDECAR_SUFFIX)
+        sidecar.write_bytes(b"not a pickle")
+
+        index = DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        assert "SFO" in index
+
+    def test_load_index_skips_unparseable_lines(self, tmp_path):
+        """Test that headers and malformed lines are skipped during indexing."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "1100 Version - data cycle 2301 header line metadata extra\n"
+            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+        )
+
+        index = DataFileReader.load_index(str(nav_file), FileType.NAV)
+
+        assert set(index) == {"SFO"}
+
+    def test_lookup_matches_read_file(self, tmp_path):
+        """Test that indexed lookup returns the same entries as a scan."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text(
+            "3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n"
+            "3 38.5 -121.5 0 11650 100 0.0 SAC SACRAMENTO VOR\n"
+        )
+
+        looked_up = DataFileReader.lookup(str(nav_file), FileType.NAV, "sfo")
+        scanned = DataFileReader.read_file(str(nav_file), FileType.NAV, "sfo")
+
+        assert looked_up == scanned
+
+    def test_lookup_unknown_identifier(self, tmp_path):
+        """Test that unknown identifiers return an empty list."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+
+        assert DataFileReader.lookup(str(nav_file), FileType.NAV, "XYZ") == []
+
+    def test_load_index_missing_file(self):
+        """Test that FileNotFoundError is raised for non-existent file."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            DataFileReader.load_index("/nonexistent/file.dat", FileType.NAV)
+
     def test_validate_file_path_valid(self, tmp_path):
         """Test validation of valid file path."""
         test_file = tmp_path / "test.dat"
@@ -149,6 +413,15 @@ class TestDataFileReader:
 
         assert "File does not exist" in result
 
+    def test_validate_file_path_dangling_symlink(self, tmp_path):
+        """Test validation of a symlink whose target is gone."""
+        link = tmp_path / "dangling.dat"
+        link.symlink_to(tmp_path / "missing.dat")
+
+        result = DataFileReader.validate_file_path(str(link))
+
+        assert "File does not exist" in result
+
     def test_validate_file_path_is_directory(self, tmp_path):
         """Test validation when path is a directory."""
         result = DataFileReader.validate_file_path(str(tmp_path))
@@ -197,18 +470,28 @@ class TestDataFileReader:
         assert results[0].identifier == "SFO"
         assert results[0].name is None  # No 10th field
 
-    def test_navaid_entry_has_raw_parts(self, tmp_path):
-        """Test that NavAidEntry contains raw_parts from file."""
+    def test_navaid_entry_has_raw_parts_when_requested(self, tmp_path):
+        """Test that NavAidEntry contains raw_parts when keep_raw is set."""
         nav_file = tmp_path / "test_nav.dat"
         nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
 
-        results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+        results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO", keep_raw=True)
 
         assert len(results) == 1
         assert results[0].raw_parts is not None
         assert len(results[0].raw_parts) > 0
         assert results[0].raw_parts[0] == "3"
 
+    def test_navaid_entry_drops_raw_parts_by_default(self, tmp_path):
+        """Test that raw_parts is not retained unless requested."""
+        nav_file = tmp_path / "test_nav.dat"
+        nav_file.write_text("3 37.6213 -122.3790 0 11770 130 0.0 SFO SAN-FRANCISCO VOR\n")
+
+        results = DataFileReader.read_file(str(nav_file), FileType.NAV, "SFO")
+
+        assert len(results) == 1
+        assert results[0].raw_parts is None
+
     def test_read_file_with_unicode_content(self, tmp_path):
         """Test reading file with unicode characters."""
         nav_file = tmp_path / "test_nav.dat"
@@ -224,13 +507,13 @@ class TestDataFileReader:
         test_file = tmp_path / "test.dat"
         test_file.write_text("test content")
 
-        # Mock open to raise a generic exception
-        def mock_open(*args, **kwargs):
-            raise IOError("Generic IO error")
+        import src.file_operations as file_operations
 
-        import builtins
+        # Mock the readability check to raise a generic OS error
+        def mock_access(*args, **kwargs):
+            raise OSError("Generic IO error")
 
-        monkeypatch.setattr(builtins, "open", mock_open)
+        monkeypatch.setattr(file_operations.os, "access", mock_access)
 
         result = DataFileReader.validate_file_path(str(test_file))
 
@@ -289,6 +289,40 @@ class TestFixFormatter:
         assert "IV28" in FixFormatter.format(result_intermediate)
 
 
+class TestFixFormatterFormatMany:
+    """Tests for FixFormatter.format_many."""
+
+    def test_matches_per_call_format(self):
+        """Test that batch output matches calling format per result."""
+        coords = Coordinates(latitude=37.621300000, longitude=-122.379000000)
+        results = [
+            FixResult(
+                coordinates=coords,
+                fix_code="V",
+                usage_code="F",
+                runway_code="28",
+                airport_code="KSFO",
+                operation_code="A",
+            ),
+            FixResult(
+                coordinates=coords,
+                fix_code="I",
+                usage_code="M",
+                runway_code="9",
+                airport_code="KLAX",
+                operation_code="D",
+            ),
+        ]
+
+        batch = FixFormatter.format_many(results)
+
+        assert batch == [FixFormatter.format(result) for result in results]
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty list."""
+        assert FixFormatter.format_many([]) == []
+
+
 class TestNavAidFormatter:
     """Tests for NavAidFormatter class."""
 
@@ -4,7 +4,15 @@ Test suite for the models module.
 
 import pytest
 
-from src.models import Coordinates, FixInput, FixResult, NavAidEntry, WaypointInput, WaypointResult
+from src.models import (
+    Coordinates,
+    CoordinatesArray,
+    FixInput,
+    FixResult,
+    NavAidEntry,
+    WaypointInput,
+    WaypointResult,
+)
 
 
 class TestCoordinates:
@@ -23,6 +31,24 @@ class TestCoordinates:
         assert "37.621300000" in result
         assert "-122.379000000" in result
 
+    def test_coordinates_string_representation_is_cached(self):
+        """Test that repeated str() calls return the same cached object."""
+        coords = Coordinates(latitude=37.6213, longitude=-122.3790)
+        assert str(coords) is str(coords)
+
+    def test_coordinates_equality_ignores_string_cache(self):
+        """Test that the string cache does not affect equality."""
+        stringified = Coordinates(latitude=37.6213, longitude=-122.3790)
+        str(stringified)
+        fresh = Coordinates(latitude=37.6213, longitude=-122.3790)
+        assert stringified == fresh
+
+    def test_coordinates_has_no_instance_dict(self):
+        """Test that slots keep instances free of a per-instance __dict__."""
+        coords = Coordinates(latitude=37.6213, longitude=-122.3790)
+        with pytest.raises(AttributeError):
+            coords.__dict__
+
     def test_coordinates_immutable(self):
         """Test that coordinates are immutable (frozen dataclass)."""
         coords = Coordinates(latitude=37.6213, longitude=-122.3790)
@@ -30,6 +56,35 @@ class TestCoordinates:
             coords.latitude = 40.0
 
 
+class TestCoordinatesArray:
+    """Tests for the CoordinatesArray class."""
+
+    def test_empty_by_default(self):
+        """Test that a fresh array holds no points."""
+        assert len(CoordinatesArray()) == 0
+
+    def test_from_coordinates_round_trip(self):
+        """Test building from Coordinates and reading points back."""
+        points = [
+            Coordinates(latitude=37.6213, longitude=-122.3790),
+            Coordinates(latitude=40.6413, longitude=-73.7781),
+        ]
+        batch = CoordinatesArray.from_coordinates(points)
+
+        assert len(batch) == 2
+        assert batch[0] == points[0]
+        assert batch[1] == points[1]
+
+    def test_iteration_yields_coordinates(self):
+        """Test that iterating materializes Coordinates objects in order."""
+        points = [
+            Coordinates(latitude=37.6213, longitude=-122.3790),
+            Coordinates(latitude=40.6413, longitude=-73.7781),
+        ]
+        batch = CoordinatesArray.from_coordinates(points)
+        assert list(batch) == points
+
+
 class TestWaypointInput:
     """Tests for the WaypointInput class."""
 
@@ -121,6 +176,17 @@ class TestNavAidEntry:
         assert navaid.identifier == "SFO"
         assert navaid.name == "San Francisco"
 
+    def test_navaid_entry_has_no_instance_dict(self):
+        """Test that slots keep entries free of a per-instance __dict__."""
+        navaid = NavAidEntry(
+            type_code="VOR",
+            latitude=37.6213,
+            longitude=-122.3790,
+            identifier="SFO",
+        )
+        with pytest.raises(AttributeError):
+            navaid.__dict__
+
     def test_navaid_display_name_with_name(self):
         """Test display name when name is provided."""
         navaid = NavAidEntry(
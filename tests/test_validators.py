@@ -2,6 +2,13 @@
 Test suite for the validators module.
 """
 
+import functools
+import math
+import os
+import re
+import time
+from contextlib import contextmanager
+
 import pytest
 
 from src.models import Coordinates
@@ -11,12 +18,54 @@ from src.validators import (
     CoordinateValidator,
     DeclinationValidator,
     DistanceValidator,
+    FailCode,
     RunwayCodeValidator,
     ValidationError,
     VORIdentifierValidator,
+    clear_validator_caches,
 )
 
 
+@contextmanager
+def _raises_with(message):
+    """Assert a ValidationError whose text contains the given substring.
+
+    A plain substring check skips the regex engine that
+    pytest.raises(match=...) runs for every negative test.
+    """
+    with pytest.raises(ValidationError) as excinfo:
+        yield
+    assert message in str(excinfo.value)
+
+
+def expect_raises(message):
+    """Wrap a test whose entire body must raise a ValidationError.
+
+    One-line negative tests read as a decorator plus the offending call,
+    instead of repeating an inline context-manager block.
+    """
+
+    def decorate(test_fn):
+        @functools.wraps(test_fn)
+        def wrapper(*args, **kwargs):
+            with _raises_with(message):
+                test_fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+# Canonical expected value, built once; Coordinates is frozen so a module
+# -level instance is safe to compare against in every parse test
+_SFO_COORDS = Coordinates(latitude=37.6213, longitude=-122.3790)
+
+# Expected-message patterns compiled once for the raising tests below
+_LAT_RANGE_RE = re.compile("Latitude must be between")
+_LON_RANGE_RE = re.compile("Longitude must be between")
+_LETTERS_ONLY_RE = re.compile("must contain only letters")
+
+
 class TestValidationError:
     """Tests for ValidationError exception."""
 
@@ -39,25 +88,20 @@ class TestCoordinateValidator:
         """Test validation of valid coordinates."""
         CoordinateValidator.validate(37.6213, -122.3790)  # Should not raise
 
-    def test_latitude_too_high(self):
-        """Test that latitude above 90 raises error."""
-        with pytest.raises(ValidationError, match="Latitude must be between"):
-            CoordinateValidator.validate(91.0, 0.0)
-
-    def test_latitude_too_low(self):
-        """Test that latitude below -90 raises error."""
-        with pytest.raises(ValidationError, match="Latitude must be between"):
-            CoordinateValidator.validate(-91.0, 0.0)
-
-    def test_longitude_too_high(self):
-        """Test that longitude above 180 raises error."""
-        with pytest.raises(ValidationError, match="Longitude must be between"):
-            CoordinateValidator.validate(0.0, 181.0)
-
-    def test_longitude_too_low(self):
-        """Test that longitude below -180 raises error."""
-        with pytest.raises(ValidationError, match="Longitude must be between"):
-            CoordinateValidator.validate(0.0, -181.0)
+    @pytest.mark.parametrize(
+        "latitude,longitude,match",
+        [
+            (91.0, 0.0, _LAT_RANGE_RE),
+            (-91.0, 0.0, _LAT_RANGE_RE),
+            (0.0, 181.0, _LON_RANGE_RE),
+            (0.0, -181.0, _LON_RANGE_RE),
+        ],
+        ids=["lat-high", "lat-low", "lon-high", "lon-low"],
+    )
+    def test_out_of_range_coordinates(self, latitude, longitude, match):
+        """Test that out-of-range coordinates raise the matching error."""
+        with pytest.raises(ValidationError, match=match):
+            CoordinateValidator.validate(latitude, longitude)
 
     def test_boundary_values_valid(self):
         """Test that boundary values are valid."""
@@ -65,47 +109,67 @@ class TestCoordinateValidator:
         CoordinateValidator.validate(-90.0, -180.0)  # Min values
         CoordinateValidator.validate(0.0, 0.0)  # Zero
 
-    def test_parse_valid_coordinates(self):
+    def test_try_validate_ok(self):
+        """Test that valid coordinates return OK without raising."""
+        assert CoordinateValidator.try_validate(37.6213, -122.3790) is FailCode.OK
+
+    def test_try_validate_latitude_out_of_range(self):
+        """Test that invalid latitude returns its fail code."""
+        assert CoordinateValidator.try_validate(91.0, 0.0) is FailCode.LAT_OUT_OF_RANGE
+
+    def test_try_validate_longitude_out_of_range(self):
+        """Test that invalid longitude returns its fail code."""
+        assert CoordinateValidator.try_validate(0.0, 181.0) is FailCode.LON_OUT_OF_RANGE
+
+    def test_parse_valid_coordinates(self, sfo_coords):
         """Test parsing valid coordinate string."""
-        result = CoordinateValidator.parse_coordinates("37.6213 -122.3790")
-        assert isinstance(result, Coordinates)
-        assert result.latitude == 37.6213
-        assert result.longitude == -122.3790
+        assert type(sfo_coords) is Coordinates
+        assert sfo_coords == _SFO_COORDS
 
     def test_parse_coordinates_with_extra_whitespace(self):
         """Test parsing coordinates with extra whitespace."""
         result = CoordinateValidator.parse_coordinates("  37.6213   -122.3790  ")
-        assert result.latitude == 37.6213
-        assert result.longitude == -122.3790
-
-    def test_parse_empty_string(self):
-        """Test that empty string raises error."""
-        with pytest.raises(ValidationError, match="Coordinates cannot be empty"):
-            CoordinateValidator.parse_coordinates("")
-
-    def test_parse_whitespace_only(self):
-        """Test that whitespace-only string raises error."""
-        with pytest.raises(ValidationError, match="Coordinates cannot be empty"):
-            CoordinateValidator.parse_coordinates("   ")
-
+        assert result == _SFO_COORDS
+
+    def test_parse_equal_for_equivalent_formats(self):
+        """Test differently formatted strings parse to equal Coordinates."""
+        assert CoordinateValidator.parse_coordinates("37.62130 -122.37900") == _SFO_COORDS
+
+    def test_parse_coordinates_raw_returns_floats(self):
+        """Test that the raw parse returns a bare float tuple."""
+        result = CoordinateValidator.parse_coordinates_raw("37.6213 -122.3790")
+        assert result == (37.6213, -122.3790)
+        assert type(result) is tuple
+
+    def test_parse_coordinates_raw_validates(self):
+        """Test that the raw parse still range-checks."""
+        with pytest.raises(ValidationError, match=_LAT_RANGE_RE):
+            CoordinateValidator.parse_coordinates_raw("91.0 0.0")
+
+    def test_parse_scientific_notation(self):
+        """Test that scientific notation still parses via the fallback path."""
+        result = CoordinateValidator.parse_coordinates("1e1 -1.5e2")
+        assert result.latitude == 10.0
+        assert result.longitude == -150.0
+
+    @expect_raises("must be in format")
     def test_parse_single_value(self):
         """Test that single value raises error."""
-        with pytest.raises(ValidationError, match="must be in format"):
-            CoordinateValidator.parse_coordinates("37.6213")
+        CoordinateValidator.parse_coordinates("37.6213")
 
+    @expect_raises("must be in format")
     def test_parse_three_values(self):
         """Test that three values raises error."""
-        with pytest.raises(ValidationError, match="must be in format"):
-            CoordinateValidator.parse_coordinates("37.6213 -122.3790 100")
+        CoordinateValidator.parse_coordinates("37.6213 -122.3790 100")
 
+    @expect_raises("Invalid coordinate format")
     def test_parse_non_numeric(self):
         """Test that non-numeric values raise error."""
-        with pytest.raises(ValidationError, match="Invalid coordinate format"):
-            CoordinateValidator.parse_coordinates("abc def")
+        CoordinateValidator.parse_coordinates("abc def")
 
     def test_parse_invalid_coordinates_raises_validation_error(self):
         """Test that invalid coordinates in string raise ValidationError."""
-        with pytest.raises(ValidationError, match="Latitude must be between"):
+        with pytest.raises(ValidationError, match=_LAT_RANGE_RE):
             CoordinateValidator.parse_coordinates("91.0 0.0")
 
 
@@ -124,20 +188,15 @@ class TestBearingValidator:
         """Test that bearing 360 is valid."""
         BearingValidator.validate(360.0)
 
-    def test_bearing_negative(self):
-        """Test that negative bearing raises error."""
-        with pytest.raises(ValidationError, match="Bearing must be between"):
-            BearingValidator.validate(-1.0)
+    @pytest.mark.parametrize("bearing", [-1.0, 361.0], ids=["negative", "over-360"])
+    def test_bearing_out_of_range(self, bearing):
+        """Test that out-of-range bearings raise error."""
+        with _raises_with("Bearing must be between"):
+            BearingValidator.validate(bearing)
 
-    def test_bearing_over_360(self):
-        """Test that bearing over 360 raises error."""
-        with pytest.raises(ValidationError, match="Bearing must be between"):
-            BearingValidator.validate(361.0)
-
-    def test_parse_valid_bearing(self):
+    def test_parse_valid_bearing(self, parsed_bearing):
         """Test parsing valid bearing string."""
-        result = BearingValidator.parse("180")
-        assert result == 180.0
+        assert parsed_bearing == 180.0
 
     def test_parse_bearing_with_decimals(self):
         """Test parsing bearing with decimals."""
@@ -154,20 +213,19 @@ class TestBearingValidator:
         result = BearingValidator.parse("360")
         assert result == 0.0
 
-    def test_parse_empty_bearing(self):
-        """Test that empty bearing raises error."""
-        with pytest.raises(ValidationError, match="Bearing cannot be empty"):
-            BearingValidator.parse("")
-
-    def test_parse_whitespace_bearing(self):
-        """Test that whitespace-only bearing raises error."""
-        with pytest.raises(ValidationError, match="Bearing cannot be empty"):
-            BearingValidator.parse("   ")
+    def test_parse_normalization_matches_modulo_contract(self):
+        """Test that the endpoint fold equals a plain modulo over the range."""
+        for thousandth in range(0, 360001, 541):
+            value = thousandth / 1000.0
+            assert BearingValidator.parse(str(value)) == (0.0 if value == 360.0 else value)
+        # The exact endpoint folds to zero; everything below passes through
+        assert BearingValidator.parse("360.0") == 0.0
+        assert BearingValidator.parse(str(math.nextafter(360.0, 0.0))) == math.nextafter(360.0, 0.0)
 
+    @expect_raises("Invalid bearing format")
     def test_parse_non_numeric_bearing(self):
         """Test that non-numeric bearing raises error."""
-        with pytest.raises(ValidationError, match="Invalid bearing format"):
-            BearingValidator.parse("abc")
+        BearingValidator.parse("abc")
 
 
 class TestDistanceValidator:
@@ -177,39 +235,29 @@ class TestDistanceValidator:
         """Test validation of valid distance."""
         DistanceValidator.validate(10.0)  # Should not raise
 
-    def test_distance_zero_invalid(self):
-        """Test that zero distance is invalid."""
-        with pytest.raises(ValidationError, match="Distance must be greater than"):
-            DistanceValidator.validate(0.0)
-
-    def test_distance_negative_invalid(self):
-        """Test that negative distance is invalid."""
-        with pytest.raises(ValidationError, match="Distance must be greater than"):
-            DistanceValidator.validate(-1.0)
+    @pytest.mark.parametrize("distance", [0.0, -1.0], ids=["zero", "negative"])
+    def test_non_positive_distance_invalid(self, distance):
+        """Test that zero and negative distances are invalid."""
+        with _raises_with("Distance must be greater than"):
+            DistanceValidator.validate(distance)
 
     def test_distance_very_small_valid(self):
         """Test that very small positive distance is valid."""
         DistanceValidator.validate(0.01)  # Should not raise
 
-    def test_parse_valid_distance(self):
+    def test_parse_valid_distance(self, parsed_distance):
         """Test parsing valid distance string."""
-        result = DistanceValidator.parse("10.5")
-        assert result == 10.5
+        assert parsed_distance == 10.5
 
     def test_parse_distance_with_whitespace(self):
         """Test parsing distance with whitespace."""
         result = DistanceValidator.parse("  10.5  ")
         assert result == 10.5
 
-    def test_parse_empty_distance(self):
-        """Test that empty distance raises error."""
-        with pytest.raises(ValidationError, match="Distance cannot be empty"):
-            DistanceValidator.parse("")
-
+    @expect_raises("Invalid distance format")
     def test_parse_non_numeric_distance(self):
         """Test that non-numeric distance raises error."""
-        with pytest.raises(ValidationError, match="Invalid distance format"):
-            DistanceValidator.parse("abc")
+        DistanceValidator.parse("abc")
 
 
 class TestDeclinationValidator:
@@ -231,15 +279,11 @@ class TestDeclinationValidator:
         """Test zero declination."""
         DeclinationValidator.validate(0.0)  # Should not raise
 
-    def test_declination_too_high(self):
-        """Test that declination above 180 raises error."""
-        with pytest.raises(ValidationError, match="Declination must be between"):
-            DeclinationValidator.validate(181.0)
-
-    def test_declination_too_low(self):
-        """Test that declination below -180 raises error."""
-        with pytest.raises(ValidationError, match="Declination must be between"):
-            DeclinationValidator.validate(-181.0)
+    @pytest.mark.parametrize("declination", [181.0, -181.0], ids=["too-high", "too-low"])
+    def test_declination_out_of_range(self, declination):
+        """Test that out-of-range declinations raise error."""
+        with _raises_with("Declination must be between"):
+            DeclinationValidator.validate(declination)
 
     def test_parse_valid_declination(self):
         """Test parsing valid declination string."""
@@ -256,15 +300,10 @@ class TestDeclinationValidator:
         result = DeclinationValidator.parse("  15.5  ")
         assert result == 15.5
 
-    def test_parse_empty_declination(self):
-        """Test that empty declination raises error."""
-        with pytest.raises(ValidationError, match="Declination cannot be empty"):
-            DeclinationValidator.parse("")
-
+    @expect_raises("Invalid declination format")
     def test_parse_non_numeric_declination(self):
         """Test that non-numeric declination raises error."""
-        with pytest.raises(ValidationError, match="Invalid declination format"):
-            DeclinationValidator.parse("abc")
+        DeclinationValidator.parse("abc")
 
 
 class TestAirportCodeValidator:
@@ -278,35 +317,31 @@ class TestAirportCodeValidator:
         """Test that lowercase code is accepted in validate."""
         AirportCodeValidator.validate("ksfo")  # Should not raise
 
+    @expect_raises("Airport code cannot be empty")
     def test_airport_code_empty(self):
         """Test that empty code raises error."""
-        with pytest.raises(ValidationError, match="Airport code cannot be empty"):
-            AirportCodeValidator.validate("")
-
-    def test_airport_code_too_short(self):
-        """Test that short code raises error."""
-        with pytest.raises(ValidationError, match="must be exactly 4 characters"):
-            AirportCodeValidator.validate("KSF")
-
-    def test_airport_code_too_long(self):
-        """Test that long code raises error."""
-        with pytest.raises(ValidationError, match="must be exactly 4 characters"):
-            AirportCodeValidator.validate("KSFOO")
-
-    def test_airport_code_with_numbers(self):
-        """Test that code with numbers raises error."""
-        with pytest.raises(ValidationError, match="must contain only letters"):
-            AirportCodeValidator.validate("KSF1")
-
-    def test_airport_code_with_special_chars(self):
-        """Test that code with special chars raises error."""
-        with pytest.raises(ValidationError, match="must contain only letters"):
-            AirportCodeValidator.validate("KS-F")
-
-    def test_parse_valid_airport_code(self):
+        AirportCodeValidator.validate("")
+
+    @pytest.mark.parametrize(
+        "code,match",
+        [
+            ("KSF", "must be exactly 4 characters"),
+            ("KSFOO", "must be exactly 4 characters"),
+            ("KSF1", _LETTERS_ONLY_RE),
+            ("KS-F", _LETTERS_ONLY_RE),
+            # Non-ASCII letters are rejected despite being alphabetic
+            ("KSFÉ", _LETTERS_ONLY_RE),
+        ],
+        ids=["too-short", "too-long", "digit", "hyphen", "non-ascii"],
+    )
+    def test_invalid_airport_code(self, code, match):
+        """Test that malformed airport codes raise the matching error."""
+        with pytest.raises(ValidationError, match=match):
+            AirportCodeValidator.validate(code)
+
+    def test_parse_valid_airport_code(self, parsed_airport_code):
         """Test parsing valid airport code."""
-        result = AirportCodeValidator.parse("ksfo")
-        assert result == "KSFO"
+        assert parsed_airport_code == "KSFO"
 
     def test_parse_airport_code_with_whitespace(self):
         """Test parsing airport code with whitespace."""
@@ -329,35 +364,31 @@ class TestVORIdentifierValidator:
         """Test that empty identifier is valid when allowed."""
         VORIdentifierValidator.validate("", allow_empty=True)  # Should not raise
 
+    @expect_raises("VOR identifier cannot be empty")
     def test_vor_identifier_empty_when_not_allowed(self):
         """Test that empty identifier raises error when not allowed."""
-        with pytest.raises(ValidationError, match="VOR identifier cannot be empty"):
-            VORIdentifierValidator.validate("", allow_empty=False)
-
-    def test_vor_identifier_too_short(self):
-        """Test that short identifier raises error."""
-        with pytest.raises(ValidationError, match="must be 3-4 characters"):
-            VORIdentifierValidator.validate("SF")
-
-    def test_vor_identifier_too_long(self):
-        """Test that long identifier raises error."""
-        with pytest.raises(ValidationError, match="must be 3-4 characters"):
-            VORIdentifierValidator.validate("KSFOO")
-
-    def test_vor_identifier_with_numbers(self):
-        """Test that identifier with numbers raises error."""
-        with pytest.raises(ValidationError, match="must contain only letters"):
-            VORIdentifierValidator.validate("SF1")
-
-    def test_vor_identifier_with_special_chars(self):
-        """Test that identifier with special chars raises error."""
-        with pytest.raises(ValidationError, match="must contain only letters"):
-            VORIdentifierValidator.validate("SF-")
-
-    def test_parse_valid_vor_identifier(self):
+        VORIdentifierValidator.validate("", allow_empty=False)
+
+    @pytest.mark.parametrize(
+        "identifier,match",
+        [
+            ("SF", "must be 3-4 characters"),
+            ("KSFOO", "must be 3-4 characters"),
+            ("SF1", _LETTERS_ONLY_RE),
+            ("SF-", _LETTERS_ONLY_RE),
+            # Non-ASCII letters are rejected despite being alphabetic
+            ("SFÉ", _LETTERS_ONLY_RE),
+        ],
+        ids=["too-short", "too-long", "digit", "hyphen", "non-ascii"],
+    )
+    def test_invalid_vor_identifier(self, identifier, match):
+        """Test that malformed identifiers raise the matching error."""
+        with pytest.raises(ValidationError, match=match):
+            VORIdentifierValidator.validate(identifier)
+
+    def test_parse_valid_vor_identifier(self, parsed_vor_identifier):
         """Test parsing valid VOR identifier."""
-        result = VORIdentifierValidator.parse("sfo")
-        assert result == "SFO"
+        assert parsed_vor_identifier == "SFO"
 
     def test_parse_vor_identifier_with_whitespace(self):
         """Test parsing VOR identifier with whitespace."""
@@ -390,15 +421,11 @@ class TestRunwayCodeValidator:
         """Test that runway code 99 is valid."""
         RunwayCodeValidator.validate(99)  # Should not raise
 
-    def test_runway_code_negative(self):
-        """Test that negative runway code raises error."""
-        with pytest.raises(ValidationError, match="Runway code must be between"):
-            RunwayCodeValidator.validate(-1)
-
-    def test_runway_code_over_max(self):
-        """Test that runway code over 99 raises error."""
-        with pytest.raises(ValidationError, match="Runway code must be between"):
-            RunwayCodeValidator.validate(100)
+    @pytest.mark.parametrize("code", [-1, 100], ids=["negative", "over-max"])
+    def test_runway_code_out_of_range(self, code):
+        """Test that out-of-range runway codes raise error."""
+        with _raises_with("Runway code must be between"):
+            RunwayCodeValidator.validate(code)
 
     def test_parse_valid_runway_code(self):
         """Test parsing valid runway code."""
@@ -415,17 +442,203 @@ class TestRunwayCodeValidator:
         result = RunwayCodeValidator.parse("9")
         assert result == 9
 
-    def test_parse_empty_runway_code(self):
-        """Test that empty runway code raises error."""
-        with pytest.raises(ValidationError, match="Runway code cannot be empty"):
-            RunwayCodeValidator.parse("")
-
-    def test_parse_non_numeric_runway_code(self):
-        """Test that non-numeric runway code raises error."""
-        with pytest.raises(ValidationError, match="Invalid runway code format"):
-            RunwayCodeValidator.parse("abc")
-
-    def test_parse_decimal_runway_code(self):
-        """Test that decimal runway code raises error."""
-        with pytest.raises(ValidationError, match="Invalid runway code format"):
-            RunwayCodeValidator.parse("18.5")
+    @pytest.mark.parametrize("code_str", ["abc", "18.5"], ids=["letters", "decimal"])
+    def test_parse_malformed_runway_code(self, code_str):
+        """Test that non-integer runway codes raise error."""
+        with _raises_with("Invalid runway code format"):
+            RunwayCodeValidator.parse(code_str)
+
+
+class TestBearingCaseTable:
+    """Table-driven bearing cases generated via pytest_generate_tests."""
+
+    def test_bearing_case(self, bearing_case):
+        """Test each table row, dispatching on expected outcome."""
+        raw, expected, error = bearing_case
+        if error is None:
+            assert BearingValidator.parse(raw) == expected
+        else:
+            with _raises_with(error):
+                BearingValidator.parse(raw)
+
+
+class TestParseRoundTrip:
+    """Round-trip sweeps feeding many formatted values through each parser."""
+
+    @pytest.mark.parametrize("pad", ["", "  ", "\t"], ids=["bare", "spaces", "tab"])
+    def test_bearing_round_trip(self, pad):
+        """Test that formatted bearings across the range parse back exactly."""
+        for tenth in range(0, 3600, 37):
+            value = tenth / 10.0
+            assert BearingValidator.parse(f"{pad}{value}{pad}") == value
+
+    @pytest.mark.parametrize("pad", ["", "  ", "\t"], ids=["bare", "spaces", "tab"])
+    def test_distance_round_trip(self, pad):
+        """Test that formatted distances parse back exactly."""
+        for hundredth in range(1, 5000, 83):
+            value = hundredth / 100.0
+            assert DistanceValidator.parse(f"{pad}{value}{pad}") == value
+
+    @pytest.mark.parametrize("pad", ["", "  ", "\t"], ids=["bare", "spaces", "tab"])
+    def test_declination_round_trip(self, pad):
+        """Test that formatted declinations across both signs parse back."""
+        for tenth in range(-1800, 1801, 61):
+            value = tenth / 10.0
+            assert DeclinationValidator.parse(f"{pad}{value}{pad}") == value
+
+    @pytest.mark.parametrize("pad", ["", "  ", "\t"], ids=["bare", "spaces", "tab"])
+    def test_runway_code_round_trip(self, pad):
+        """Test that every runway code parses back to its integer."""
+        for code in range(100):
+            assert RunwayCodeValidator.parse(f"{pad}{code}{pad}") == code
+
+
+class TestParsePerformanceGuard:
+    """Opt-in microbenchmark guarding the coordinate parse fast path."""
+
+    @pytest.mark.skipif(
+        not os.environ.get("RUN_BENCHMARKS"),
+        reason="perf guard; set RUN_BENCHMARKS=1 to run",
+    )
+    def test_parse_coordinates_stays_within_budget(self):
+        """Test that 10k padded parses stay inside the CI time budget."""
+        raw = "  37.6213   -122.3790  "
+        start = time.perf_counter_ns()
+        for _ in range(10_000):
+            CoordinateValidator.parse_coordinates_raw(raw)
+        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+
+        # Generous budget: the compiled-regex fast path clears this by an
+        # order of magnitude; tripping it signals a parser regression
+        assert elapsed_ms < 50
+
+
+class TestBlankParseInputs:
+    """Blank-input behavior for every parsing validator in one matrix."""
+
+    @pytest.mark.parametrize("raw", ["", "   "], ids=["empty", "whitespace"])
+    @pytest.mark.parametrize(
+        "parse,message",
+        [
+            (CoordinateValidator.parse_coordinates, "Coordinates cannot be empty"),
+            (BearingValidator.parse, "Bearing cannot be empty"),
+            (DistanceValidator.parse, "Distance cannot be empty"),
+            (DeclinationValidator.parse, "Declination cannot be empty"),
+            (RunwayCodeValidator.parse, "Runway code cannot be empty"),
+        ],
+        ids=["coordinates", "bearing", "distance", "declination", "runway"],
+    )
+    def test_blank_input_raises(self, parse, message, raw):
+        """Test that empty and whitespace-only inputs raise per validator."""
+        with _raises_with(message):
+            parse(raw)
+
+
+class TestBoundarySweep:
+    """Sweep tests pinning every numeric validator exactly at its bounds."""
+
+    @staticmethod
+    def _outcome(validator, *args):
+        """Return True when validation passes, False when it raises."""
+        try:
+            validator(*args)
+        except ValidationError:
+            return False
+        return True
+
+    def test_coordinate_boundary_transitions(self):
+        """Test acceptance flips exactly at the coordinate bounds."""
+        for bound in (90.0, -90.0):
+            inside = math.nextafter(bound, 0.0)
+            outside = math.nextafter(bound, math.copysign(math.inf, bound))
+            assert self._outcome(CoordinateValidator.validate, inside, 0.0)
+            assert self._outcome(CoordinateValidator.validate, bound, 0.0)
+            assert not self._outcome(CoordinateValidator.validate, outside, 0.0)
+
+        for bound in (180.0, -180.0):
+            inside = math.nextafter(bound, 0.0)
+            outside = math.nextafter(bound, math.copysign(math.inf, bound))
+            assert self._outcome(CoordinateValidator.validate, 0.0, inside)
+            assert self._outcome(CoordinateValidator.validate, 0.0, bound)
+            assert not self._outcome(CoordinateValidator.validate, 0.0, outside)
+
+    @pytest.mark.parametrize(
+        "validator,low,high",
+        [
+            (BearingValidator.validate, 0.0, 360.0),
+            (DeclinationValidator.validate, -180.0, 180.0),
+            (RunwayCodeValidator.validate, 0, 99),
+        ],
+        ids=["bearing", "declination", "runway"],
+    )
+    def test_closed_range_boundary_transitions(self, validator, low, high):
+        """Test acceptance flips exactly at each closed-range bound."""
+        assert self._outcome(validator, low)
+        assert self._outcome(validator, high)
+        assert not self._outcome(validator, low - 1)
+        assert not self._outcome(validator, high + 1)
+
+    def test_distance_open_lower_bound(self):
+        """Test that distance accepts any positive value but not zero."""
+        assert not self._outcome(DistanceValidator.validate, 0.0)
+        assert self._outcome(DistanceValidator.validate, math.nextafter(0.0, 1.0))
+
+
+class TestAlreadyNormalizedParse:
+    """Tests for the already_normalized fast path."""
+
+    def test_airport_code_skips_normalization(self):
+        """Test that normalized airport codes pass straight through."""
+        assert AirportCodeValidator.parse("KSFO", already_normalized=True) == "KSFO"
+
+    def test_airport_code_still_validated(self):
+        """Test that invalid pre-normalized codes still raise."""
+        with _raises_with("must be exactly 4 characters"):
+            AirportCodeValidator.parse("KSF", already_normalized=True)
+
+    def test_vor_identifier_skips_normalization(self):
+        """Test that normalized VOR identifiers pass straight through."""
+        assert VORIdentifierValidator.parse("SFO", already_normalized=True) == "SFO"
+
+    def test_vor_identifier_still_validated(self):
+        """Test that allow_empty is honored on the fast path."""
+        with _raises_with("cannot be empty"):
+            VORIdentifierValidator.parse("", allow_empty=False, already_normalized=True)
+
+
+class TestValidatorCaches:
+    """Tests for the memoized parse helpers."""
+
+    def test_repeated_parse_is_cached(self):
+        """Test that repeated parses of the same input hit the cache."""
+        clear_validator_caches()
+        first = AirportCodeValidator.parse("ksfo")
+        second = AirportCodeValidator.parse("ksfo")
+        assert first == second == "KSFO"
+        assert first is second
+
+    def test_allow_empty_is_part_of_cache_key(self):
+        """Test that allow_empty distinguishes cached VOR identifier results."""
+        clear_validator_caches()
+        assert VORIdentifierValidator.parse("", allow_empty=True) == ""
+        with _raises_with("cannot be empty"):
+            VORIdentifierValidator.parse("", allow_empty=False)
+
+    def test_repeated_vor_parse_hits_cache(self):
+        """Test that the allow_empty VOR parse is served from the cache."""
+        from src.validators import _parse_vor_identifier
+
+        clear_validator_caches()
+        VORIdentifierValidator.parse("", allow_empty=True)
+        before = _parse_vor_identifier.cache_info().hits
+
+        VORIdentifierValidator.parse("", allow_empty=True)
+
+        assert _parse_vor_identifier.cache_info().hits == before + 1
+
+    def test_clear_validator_caches(self):
+        """Test that clearing the caches resets cached results."""
+        clear_validator_caches()
+        assert RunwayCodeValidator.parse("18") == 18
+        clear_validator_caches()
+        assert RunwayCodeValidator.parse("18") == 18